@@ -82,11 +82,11 @@
                        MutableMatrix, MutableSparseMatrix,
                        NonSquareMatrixError, ShapeError, SparseMatrix, Trace,
                        Transpose, ZeroMatrix, block_collapse, blockcut,
-                       casoratian, det, diag, eye, hadamard_product, hessian,
-                       jordan_cell, list2numpy, matrix2numpy,
-                       matrix_multiply_elementwise, ones, randMatrix,
-                       rot_axis1, rot_axis2, rot_axis3, trace,
-                       vandermonde, wronskian, zeros)
+                       casoratian, det, diag, eye, hadamard_product,
+                       hermite_normal_form, hessian, jordan_cell, list2numpy,
+                       matrix2numpy, matrix_multiply_elementwise, ones,
+                       randMatrix, rot_axis1, rot_axis2, rot_axis3,
+                       smith_normal_form, trace, vandermonde, wronskian, zeros)
 from .ntheory import (Sieve, binomial_coefficients, binomial_coefficients_list,
                       continued_fraction_convergents,
                       continued_fraction_iterator, continued_fraction_periodic,
@@ -256,10 +256,12 @@
     'MatrixSlice', 'MatrixSymbol', 'MutableDenseMatrix', 'MutableMatrix',
     'MutableSparseMatrix', 'NonSquareMatrixError', 'ShapeError', 'SparseMatrix',
     'Trace', 'Transpose', 'ZeroMatrix', 'block_collapse', 'blockcut',
-    'casoratian', 'det', 'diag', 'eye', 'hadamard_product', 'hessian',
+    'casoratian', 'det', 'diag', 'eye', 'hadamard_product',
+    'hermite_normal_form', 'hessian',
     'jordan_cell', 'list2numpy', 'matrix2numpy', 'matrix_multiply_elementwise',
     'ones', 'randMatrix', 'rot_axis1', 'rot_axis2', 'rot_axis3',
-    'trace', 'vandermonde', 'wronskian', 'zeros', 'Fraction',
+    'smith_normal_form', 'trace', 'vandermonde', 'wronskian', 'zeros',
+    'Fraction',
     'cantor_product', 'default_sort_key',
     'filldedent', 'flatten', 'group', 'lambdify',
     'numbered_symbols', 'ordered', 'postorder_traversal',
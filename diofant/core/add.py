@@ -13,6 +13,8 @@
 class Add(AssocOp):
     """Symbolic addition class."""
 
+    __slots__ = ()
+
     is_Add = True
 
     identity = Integer(0)
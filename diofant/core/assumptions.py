@@ -46,6 +46,7 @@
 
 from random import shuffle
 
+from .basic import BasicMeta
 from .facts import FactKB, FactRules
 from .sympify import sympify
 
@@ -473,10 +474,10 @@ def _ask(fact, obj):
                 return ret_val
 
 
-class ManagedProperties(type):
+class ManagedProperties(BasicMeta):
     """Metaclass for classes with old-style assumptions."""
 
-    def __init__(cls, *args, **kws):
+    def __init__(cls, *args, **kws):  # noqa: N805
         """Initialize cls."""
         super().__init__(cls)
         local_defs = {}
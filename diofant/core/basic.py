@@ -1,7 +1,9 @@
 """Base class for all the objects in Diofant."""
 
+import weakref
 from collections import defaultdict
 from collections.abc import Mapping
+from contextlib import contextmanager
 from itertools import zip_longest
 
 from ..utilities import ordered
@@ -12,7 +14,112 @@
 from .sympify import SympifyError, sympify
 
 
-class Basic:
+class BasicMeta(type):
+    """Metaclass for all classes of Diofant objects.
+
+    See Also
+    ========
+
+    interning
+
+    """
+
+
+class _Ref:
+    """Wrapper, that compares and hashes objects by identity."""
+
+    __slots__ = ('obj',)
+
+    def __init__(self, obj):
+        """Initialize self."""
+        self.obj = obj
+
+    def __hash__(self):
+        return id(self.obj)
+
+    def __eq__(self, other):
+        return self.obj is other.obj
+
+
+def _intern_key(content):
+    if isinstance(content, Basic):
+        return _Ref(content)
+    if isinstance(content, tuple):
+        return tuple(map(_intern_key, content))
+    if isinstance(content, frozenset):
+        return frozenset, frozenset(map(_intern_key, content))
+    return type(content), content
+
+
+_interned: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+_canonical: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+
+def _interning_call(cls, *args, **kwargs):
+    obj = type.__call__(cls, *args, **kwargs)
+    if not isinstance(obj, Basic) or _canonical.get(id(obj)) is obj:
+        return obj
+    content = obj._hashable_content()
+    try:
+        key = (type(obj), tuple(map(_Ref, obj._args)),
+               None if content is obj._args else _intern_key(content))
+        canonical = _interned.setdefault(key, obj)
+    except TypeError:  # unhashable content
+        return obj
+    _canonical[id(canonical)] = canonical
+    return canonical
+
+
+@contextmanager
+def interning(enable=True):
+    """Control hash-consing of Diofant objects.
+
+    Within this context, constructors of Diofant objects return
+    canonical instances: an object, that has exactly same (up to
+    identity) arguments and same type and content (see
+    :meth:`~diofant.core.basic.Basic._hashable_content`), as some
+    existing canonical instance, is replaced by it.  Canonical instances
+    are kept in a weak-value table, so they are not kept alive by this
+    table.
+
+    As long as expressions are built bottom-up in this context,
+    structurally equal subtrees are shared, so memory is saved and
+    comparison of equal expressions (e.g. cache lookups) reduces to the
+    identity check.  Outside of this context, constructors have no
+    overhead.
+
+    Examples
+    ========
+
+    >>> with interning():
+    ...     e1 = sin(x + 1)
+    ...     e2 = sin(x + 1)
+    >>> e1 is e2
+    True
+
+    Objects, that are only equal (e.g. with different types of numbers)
+    are kept distinct:
+
+    >>> with interning():
+    ...     (x + 1) is (x + 1.0)
+    False
+
+    """
+    old = BasicMeta.__dict__.get('__call__')
+    if enable:
+        BasicMeta.__call__ = _interning_call
+    elif old:
+        del BasicMeta.__call__
+    try:
+        yield
+    finally:
+        if old:
+            BasicMeta.__call__ = old
+        elif '__call__' in BasicMeta.__dict__:
+            del BasicMeta.__call__
+
+
+class Basic(metaclass=BasicMeta):
     """
     Base class for all objects in Diofant.
 
@@ -20,6 +127,8 @@ class Basic:
 
     """
 
+    __slots__ = ('_hash', '_args', '__weakref__')
+
     # To be overridden with True in the appropriate subclasses
     is_number = False
     is_Atom: bool = False
@@ -1119,6 +1228,8 @@ class Atom(Basic):
 
     """
 
+    __slots__ = ()
+
     is_Atom = True
 
     def doit(self, **hints):
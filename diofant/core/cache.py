@@ -1,7 +1,9 @@
 """Caching facility for Diofant."""
 
+import collections
 import functools
 import os
+import weakref
 
 from .evaluate import global_evaluate
 
@@ -62,3 +64,84 @@ def wrapper(*args, **kwargs):
         CACHE.append(wrapper)
         return wrapper
     return f
+
+
+CacheInfo = collections.namedtuple('CacheInfo',
+                                   ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class WeakLRUCache:
+    """Mapping with weakly referenced values and a bounded LRU tail.
+
+    Values are kept alive by the cache only while they are among the
+    ``maxsize`` most recently used entries.  Other entries are available
+    as long as they are referenced somewhere else, so the mapping still
+    returns a unique instance for each key of a live object.
+
+    Clearing the cache drops only strong references, i.e. it never
+    creates a duplicate of a live value.
+
+    Examples
+    ========
+
+    >>> class Box:
+    ...     pass
+    >>> c = WeakLRUCache('c', maxsize=1)
+    >>> a, b = Box(), Box()
+    >>> c[1], c[2] = a, b
+    >>> c.get(1) is a
+    True
+    >>> del a
+    >>> c.get(1) is None
+    True
+    >>> c.get(2) is b
+    True
+
+    """
+
+    def __init__(self, name, maxsize=128):
+        """Initialize self."""
+        self.__qualname__ = name
+        self.maxsize = maxsize if USE_CACHE else 0
+        self.hits = self.misses = 0
+        self._data = weakref.WeakValueDictionary()
+        self._lru = collections.OrderedDict()
+
+        if USE_CACHE:
+            CACHE.append(self)
+
+    def _touch(self, key, value):
+        if self.maxsize:
+            self._lru[key] = value
+            self._lru.move_to_end(key)
+            if len(self._lru) > self.maxsize:
+                self._lru.popitem(last=False)
+
+    def get(self, key, default=None):
+        """Return value for ``key`` if it's alive, else ``default``."""
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(key, value)
+        return value
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+        self._touch(key, value)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def cache_info(self):
+        """Report cache statistics."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+    def cache_clear(self):
+        """Drop strong references and reset statistics."""
+        self._lru.clear()
+        self.hits = self.misses = 0
@@ -29,6 +29,8 @@ class Tuple(Basic):
 
     """
 
+    __slots__ = ()
+
     def __new__(cls, *args):
         args = (sympify(arg) for arg in args)
         return super().__new__(cls, *args)
@@ -1152,6 +1152,8 @@ def evalf(x, prec, options):
 class EvalfMixin:
     """Mixin class adding evalf capability."""
 
+    __slots__ = ()
+
     def evalf(self, dps=15, subs=None, maxn=110, chop=False, strict=True, quad=None):
         """
         Evaluate the given formula to an accuracy of dps decimal digits.
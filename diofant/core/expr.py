@@ -28,6 +28,8 @@ class Expr(Basic, EvalfMixin, metaclass=ManagedProperties):
 
     """
 
+    __slots__ = ('_assumptions',)
+
     def __new__(cls, *args, **kwargs):
         obj = Basic.__new__(cls, *args)
         obj._assumptions = cls.default_assumptions
@@ -3034,6 +3036,8 @@ class AtomicExpr(Atom, Expr):
 
     """
 
+    __slots__ = ()
+
     is_number = False
     is_Atom = True
 
@@ -92,6 +92,15 @@ class FunctionClass(ManagedProperties):
 
     """
 
+    def __new__(cls, name, bases, namespace, **kwargs):
+        # class-level nargs declaration shouldn't shadow Application.nargs
+        if not isinstance(namespace.get('nargs'), property):
+            namespace = {k: v for k, v in namespace.items() if k != 'nargs'}
+        # instances of library functions don't need the __dict__
+        if namespace.get('__module__', '').startswith('diofant.'):
+            namespace.setdefault('__slots__', ())
+        return super().__new__(cls, name, bases, namespace, **kwargs)
+
     def __init__(self, *args, **kwargs):
         """Initialize self."""
         assert hasattr(self, 'eval')
@@ -108,7 +117,11 @@ def __init__(self, *args, **kwargs):
                                        evalargs + 1))
         # honor kwarg value or class-defined value before using
         # the number of arguments in the eval function (if present)
-        nargs = kwargs.pop('nargs', self.__dict__.get('nargs', evalargs))
+        namespace = args[2] if len(args) > 2 else {}
+        nargs = namespace.get('nargs', evalargs)
+        if isinstance(nargs, property):
+            nargs = evalargs
+        nargs = kwargs.pop('nargs', nargs)
         super().__init__(args, kwargs)
 
         # Canonicalize nargs here; change to set in nargs.
@@ -186,13 +199,12 @@ class Application(Expr, metaclass=FunctionClass):
 
     """
 
+    __slots__ = ()
+
     is_Function = True
 
     @cacheit
     def __new__(cls, *args, **options):
-        from ..sets.fancysets import Naturals0
-        from ..sets.sets import FiniteSet
-
         args = list(map(sympify, args))
         evaluate = options.pop('evaluate', global_evaluate[0])
         # WildFunction (and anything else like it) may have nargs defined
@@ -210,29 +222,19 @@ def __new__(cls, *args, **options):
             if evaluated is not None:
                 return evaluated
 
-        obj = super().__new__(cls, *args, **options)
+        return super().__new__(cls, *args, **options)
 
-        # make nargs uniform here
-        try:
-            # things passing through here:
-            #  - functions subclassed from Function (e.g. myfunc(1).nargs)
-            #  - functions like cos(1).nargs
-            #  - AppliedUndef with given nargs like Function('f', nargs=1)(1).nargs
-            # Canonicalize nargs here
-            if is_sequence(obj.nargs):
-                nargs = tuple(ordered(set(obj.nargs)))
-            elif obj.nargs is not None:
-                nargs = as_int(obj.nargs),
-            else:
-                nargs = None
-        except AttributeError:
-            # things passing through here:
-            #  - WildFunction('f').nargs
-            #  - AppliedUndef with no nargs like Function('f')(1).nargs
-            nargs = obj._nargs  # note the underscore here
-
-        obj.nargs = FiniteSet(*nargs) if nargs else Naturals0()
-        return obj
+    @property
+    def nargs(self):
+        """Return a set of the allowed number of arguments for the function.
+
+        See Also
+        ========
+
+        diofant.core.function.FunctionClass.nargs
+
+        """
+        return type(self).nargs
 
     @classmethod
     def eval(cls, *args):
@@ -320,6 +322,8 @@ class Function(Application, Expr):
 
     """
 
+    __slots__ = ()
+
     @property
     def _diff_wrt(self):
         """Allow derivatives wrt functions.
@@ -636,6 +640,8 @@ class AppliedUndef(Function):
 
     """
 
+    __slots__ = ()
+
     def __new__(cls, *args, **options):
         args = list(map(sympify, args))
         obj = super().__new__(cls, *args, **options)
@@ -649,6 +655,8 @@ class UndefinedFunction(FunctionClass):
     """The (meta)class of undefined functions."""
 
     def __new__(cls, name, **kwargs):
+        kwargs = {k: v for k, v in kwargs.items() if k != 'nargs'}
+        kwargs['__slots__'] = ()
         ret = type.__new__(cls, name, (AppliedUndef,), kwargs)
         ret.__module__ = None
         return ret
@@ -725,6 +733,8 @@ class WildFunction(Function, AtomicExpr):
 
     """
 
+    __slots__ = ('name', 'nargs')
+
     def __init__(self, name, **assumptions):
         """Initialize self."""
         from ..sets.sets import FiniteSet, Set
@@ -739,6 +749,9 @@ def __init__(self, name, **assumptions):
             nargs = FiniteSet(*nargs)
         self.nargs = nargs
 
+    def _hashable_content(self):
+        return super()._hashable_content() + (self.nargs,)
+
     def _matches(self, expr, repl_dict={}):
         """Helper method for match()
 
@@ -79,6 +79,8 @@ def _unevaluated_Mul(*args):
 class Mul(AssocOp):
     """Symbolic multiplication class."""
 
+    __slots__ = ()
+
     is_Mul = True
 
     identity = S.One
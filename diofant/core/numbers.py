@@ -197,6 +197,8 @@ class Number(AtomicExpr):
 
     """
 
+    __slots__ = ()
+
     is_commutative = True
     is_number = True
     is_Number = True
@@ -463,6 +465,8 @@ class Float(Number):
 
     """
 
+    __slots__ = ('_mpf_', '_prec')
+
     is_number = True
 
     is_extended_real = True
@@ -815,6 +819,8 @@ class Rational(Number):
 
     """
 
+    __slots__ = ('_numerator', '_denominator')
+
     is_real = True
     is_integer = False
     is_rational = True
@@ -1124,6 +1130,8 @@ def denominator(self):
 class Integer(Rational):
     """Represents integer numbers."""
 
+    __slots__ = ()
+
     is_integer = True
     is_number = True
 
@@ -19,6 +19,8 @@ class AssocOp(Expr):
 
     """
 
+    __slots__ = ()
+
     @cacheit
     def __new__(cls, *args, **options):
         from ..calculus import Order
@@ -175,6 +175,8 @@ class Pow(Expr):
 
     """
 
+    __slots__ = ()
+
     is_Pow = True
 
     @cacheit
@@ -221,10 +223,12 @@ def __new__(cls, b, e, evaluate=None):
             obj = b._eval_power(e)
             if obj is not None:
                 return obj
-        obj = Expr.__new__(cls, b, e)
-        if b is E:
-            obj.is_Exp = True
-        return obj
+        return Expr.__new__(cls, b, e)
+
+    @property
+    def is_Exp(self):
+        """Test if self is an exponential, i.e. power of E."""
+        return self.base is E
 
     def _eval_is_commutative(self):
         return self.base.is_commutative and self.exp.is_commutative
@@ -1,6 +1,7 @@
 """Singleton mechanism"""
 
 from .assumptions import ManagedProperties
+from .basic import BasicMeta
 
 
 class SingletonRegistry:
@@ -86,7 +87,7 @@ def __repr__(self):
 S: SingletonRegistry = SingletonRegistry()
 
 
-class Singleton(type):
+class Singleton(BasicMeta):
     """
     Metaclass for singleton classes.
 
@@ -127,7 +128,7 @@ def __new__(cls, *args, **kwargs):
         S.register(result)
         return result
 
-    def __call__(cls, *args, **kwargs):
+    def __call__(cls, *args, **kwargs):  # noqa: N805
         # Called when application code says SomeClass(), where SomeClass is a
         # class of which Singleton is the metaclass.
         # __call__ is invoked first, before __new__() and __init__().
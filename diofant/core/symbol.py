@@ -61,6 +61,8 @@ class for both :class:`Dummy` and :class:`Wild` isn't possible,
 
     """
 
+    __slots__ = ('name',)
+
     is_comparable = False
 
     is_Symbol = True
@@ -228,6 +230,8 @@ class Symbol(BaseSymbol):
 
     """
 
+    __slots__ = ()
+
 
 class Dummy(BaseSymbol):
     """Dummy symbols are each unique, identified by an internal count index:
@@ -246,6 +250,8 @@ class Dummy(BaseSymbol):
 
     """
 
+    __slots__ = ('dummy_index',)
+
     _count = 0
 
     is_Dummy = True
@@ -350,6 +356,8 @@ class Wild(BaseSymbol):
 
     """
 
+    __slots__ = ('exclude', 'properties')
+
     is_Wild = True
 
     def __new__(cls, name, exclude=(), properties=(), **assumptions):
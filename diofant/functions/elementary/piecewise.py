@@ -62,7 +62,6 @@ class Piecewise(Function):
 
     """
 
-    nargs = None
     is_Piecewise = True
 
     def __new__(cls, *args, **options):
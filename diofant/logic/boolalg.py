@@ -16,6 +16,8 @@
 class Boolean(Expr):
     """A boolean object is an object for which logic operations make sense."""
 
+    __slots__ = ()
+
     def __and__(self, other):
         """Overloading for & operator."""
         return And(self, other)
@@ -78,6 +80,8 @@ def equals(self, other, failing_expression=False):
 class BooleanAtom(Atom, Boolean):
     """Base class of BooleanTrue and BooleanFalse."""
 
+    __slots__ = ()
+
     is_Boolean = True
 
     @property
@@ -282,8 +286,6 @@ class And(LatticeOp, BooleanFunction):
     zero = false
     identity = true
 
-    nargs = None
-
     @classmethod
     def _new_args_filter(cls, args):
         newargs = []
@@ -16,6 +16,7 @@
 from .immutable import (ImmutableDenseMatrix, ImmutableMatrix,
                         ImmutableSparseMatrix)
 from .matrices import MatrixBase, NonSquareMatrixError, ShapeError
+from .normalforms import hermite_normal_form, smith_normal_form
 from .sparse import MutableSparseMatrix, SparseMatrix
 
 
@@ -33,5 +34,6 @@
            'Transpose', 'ZeroMatrix', 'block_collapse', 'blockcut', 'det',
            'hadamard_product', 'trace', 'ImmutableDenseMatrix',
            'ImmutableMatrix', 'ImmutableSparseMatrix', 'MatrixBase',
-           'NonSquareMatrixError', 'ShapeError', 'MutableSparseMatrix',
+           'NonSquareMatrixError', 'ShapeError', 'hermite_normal_form',
+           'smith_normal_form', 'MutableSparseMatrix',
            'SparseMatrix', 'Matrix')
@@ -0,0 +1,478 @@
+"""Dense matrices over domains."""
+
+import math
+import operator
+
+from ..core import Expr
+from ..polys.constructor import construct_domain
+from . import modular
+from .matrices import NonSquareMatrixError, ShapeError
+
+
+class DomainMatrix:
+    """Dense matrix with entries in a domain.
+
+    Entries are stored as a list of rows of raw domain elements, so
+    arithmetic doesn't involve construction of expressions.
+
+    Examples
+    ========
+
+    >>> M = DomainMatrix.from_Matrix(Matrix([[1, x], [x, 1]]))
+    >>> M
+    DomainMatrix([[1, x], [x, 1]], (2, 2), ZZ[x])
+    >>> M.det()
+    -x**2 + 1
+    >>> M.inv().to_Matrix()
+    Matrix([
+    [-1/(x**2 - 1),  x/(x**2 - 1)],
+    [ x/(x**2 - 1), -1/(x**2 - 1)]])
+
+    """
+
+    def __init__(self, rows, shape, domain):
+        """Initialize self."""
+        if len(rows) != shape[0] or any(len(row) != shape[1] for row in rows):
+            raise ShapeError('Wrong number of rows or columns.')
+
+        self.rows = rows
+        self.shape = shape
+        self.domain = domain
+
+    @classmethod
+    def from_Matrix(cls, M, domain=None, **kwargs):
+        """Convert a matrix with expression entries.
+
+        If ``domain`` is not given, keyword arguments are passed to
+        :func:`~diofant.polys.constructor.construct_domain` to find a
+        domain for the entries.
+
+        """
+        rows = M.tolist()
+        elements = [e for row in rows for e in row]
+        if domain is None:
+            domain, elements = construct_domain(elements, **kwargs)
+        else:
+            elements = [domain.convert(e) for e in elements]
+        it = iter(elements)
+        return cls([[next(it) for _ in row] for row in rows], M.shape, domain)
+
+    def to_Matrix(self, cls=None):
+        """Convert to a matrix with expression entries.
+
+        Optional argument ``cls`` is a constructor for the result.
+
+        """
+        from . import Matrix
+
+        cls = cls or Matrix
+        to_expr = self.domain.to_expr
+        return cls(*self.shape, [to_expr(e) for row in self.rows for e in row])
+
+    @classmethod
+    def eye(cls, n, domain):
+        """Return the identity matrix of size ``n``."""
+        return cls([[domain.one if i == j else domain.zero
+                     for j in range(n)] for i in range(n)], (n, n), domain)
+
+    @classmethod
+    def zeros(cls, shape, domain):
+        """Return the zero matrix of given shape."""
+        return cls([[domain.zero]*shape[1] for _ in range(shape[0])],
+                   shape, domain)
+
+    def copy(self):
+        return self.__class__([list(row) for row in self.rows],
+                              self.shape, self.domain)
+
+    def convert_to(self, domain):
+        """Return the copy of ``self`` with entries in ``domain``."""
+        convert = domain.convert
+        return self.__class__([[convert(e, self.domain) for e in row]
+                               for row in self.rows], self.shape, domain)
+
+    def to_field(self):
+        """Return the copy of ``self`` over the associated field."""
+        if self.domain.is_Field:
+            return self.copy()
+        return self.convert_to(self.domain.field)
+
+    @property
+    def is_square(self):
+        return self.shape[0] == self.shape[1]
+
+    def __repr__(self):
+        rows = ', '.join('[' + ', '.join(map(str, row)) + ']'
+                         for row in self.rows)
+        return f'{self.__class__.__name__}([{rows}], {self.shape}, {self.domain})'
+
+    def __eq__(self, other):
+        if not isinstance(other, DomainMatrix):
+            return NotImplemented
+        return (self.shape == other.shape and self.domain == other.domain and
+                self.rows == other.rows)
+
+    def _check(self, other):
+        if not isinstance(other, DomainMatrix):
+            raise TypeError(f'expected DomainMatrix, got {type(other)}')
+        if self.domain != other.domain:
+            raise ValueError('domains of matrices do not match')
+
+    def __add__(self, other):
+        self._check(other)
+        if self.shape != other.shape:
+            raise ShapeError('Matrix size mismatch.')
+        return self.__class__([list(map(operator.add, a, b))
+                               for a, b in zip(self.rows, other.rows)],
+                              self.shape, self.domain)
+
+    def __neg__(self):
+        return self.__class__([[-e for e in row] for row in self.rows],
+                              self.shape, self.domain)
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __mul__(self, other):
+        if not isinstance(other, DomainMatrix):
+            other = self.domain.convert(other)
+            return self.__class__([[e*other for e in row] for row in self.rows],
+                                  self.shape, self.domain)
+        return self.matmul(other)
+
+    def matmul(self, other):
+        """Return the matrix product of ``self`` and ``other``."""
+        self._check(other)
+        if self.shape[1] != other.shape[0]:
+            raise ShapeError('Matrix size mismatch.')
+        zero = self.domain.zero
+        cols = list(zip(*other.rows))
+        rows = [[sum(map(operator.mul, row, col), zero) for col in cols]
+                for row in self.rows]
+        if not cols:
+            rows = [[] for _ in self.rows]
+        return self.__class__(rows, (self.shape[0], other.shape[1]),
+                              self.domain)
+
+    def __pow__(self, n):
+        if not self.is_square:
+            raise NonSquareMatrixError()
+        if n < 0:
+            return self.inv()**(-n)
+        result = self.eye(self.shape[0], self.domain)
+        power = self
+        while n:
+            if n % 2:
+                result = result.matmul(power)
+            n //= 2
+            if n:
+                power = power.matmul(power)
+        return result
+
+    def transpose(self):
+        """Return the transposed matrix."""
+        return self.__class__([list(col) for col in zip(*self.rows)]
+                              if self.shape[1] else [],
+                              self.shape[::-1], self.domain)
+
+    T = property(transpose)
+
+    def rref_den(self):
+        """Return the fraction-free reduced row echelon form.
+
+        Returns a tuple of the matrix, its denominator and the list of
+        pivot columns.  The reduced row echelon form of ``self`` is
+        obtained by division of the result by the denominator.  All
+        computations are done in the ground domain without division,
+        except for exact divisions by previous pivots (Bareiss' method).
+
+        Examples
+        ========
+
+        >>> M = DomainMatrix.from_Matrix(Matrix([[2, 3], [4, 5]]))
+        >>> M.rref_den()
+        (DomainMatrix([[-2, 0], [0, -2]], (2, 2), ZZ), -2, [0, 1])
+
+        """
+        K = self.domain
+        M = [list(row) for row in self.rows]
+        m, n = self.shape
+        exquo = K.exquo
+        divisor, pivots, r = K.one, [], 0
+        for j in range(n):
+            if r == m:
+                break
+            for i in range(r, m):
+                if M[i][j]:
+                    break
+            else:
+                continue
+            M[r], M[i] = M[i], M[r]
+            row = M[r]
+            pivot = row[j]
+            for i in range(m):
+                if i != r:
+                    f = M[i][j]
+                    M[i] = [exquo(pivot*a - f*b, divisor)
+                            for a, b in zip(M[i], row)]
+            divisor = pivot
+            pivots.append(j)
+            r += 1
+        return self.__class__(M, self.shape, K), divisor, pivots
+
+    def rref(self):
+        """Return the reduced row echelon form and pivot columns.
+
+        The result has entries in the associated field.
+
+        Examples
+        ========
+
+        >>> M = DomainMatrix.from_Matrix(Matrix([[2, 3], [4, 6]]))
+        >>> M.rref()
+        (DomainMatrix([[1, 3/2], [0, 0]], (2, 2), QQ), [0])
+
+        """
+        if not self.domain.is_Field:
+            M, den, pivots = self.rref_den()
+            M = M.to_field()
+            den = M.domain.convert(den, self.domain)
+            M.rows = [[e/den for e in row] for row in M.rows]
+            return M, pivots
+
+        K = self.domain
+        M = [list(row) for row in self.rows]
+        m, n = self.shape
+        pivots, r = [], 0
+        for j in range(n):
+            if r == m:
+                break
+            for i in range(r, m):
+                if M[i][j]:
+                    break
+            else:
+                continue
+            M[r], M[i] = M[i], M[r]
+            inv = K.one/M[r][j]
+            row = M[r] = [a*inv for a in M[r]]
+            for i in range(m):
+                if i != r and (f := M[i][j]):
+                    M[i] = [a - f*b for a, b in zip(M[i], row)]
+            pivots.append(j)
+            r += 1
+        return self.__class__(M, self.shape, K), pivots
+
+    def rank(self):
+        """Return the rank of ``self``."""
+        return len(self.rref_den()[2])
+
+    def det(self):
+        """Return the determinant of ``self``.
+
+        For integer and rational matrices the multi-modular algorithm
+        is used.  Over other fields, the determinant is computed by the
+        Gaussian elimination, else by Bareiss' fraction-free algorithm.
+
+        Examples
+        ========
+
+        >>> M = DomainMatrix.from_Matrix(Matrix([[x, 1], [1, x]]))
+        >>> M.det()
+        x**2 - 1
+
+        See Also
+        ========
+
+        diofant.matrices.modular.det
+
+        """
+        if not self.is_square:
+            raise NonSquareMatrixError()
+        K, n = self.domain, self.shape[0]
+
+        if K.is_IntegerRing and n > 8:
+            return K(modular.det(self.rows))
+        if K.is_RationalField and n > 8:
+            M, den = [], K.one
+            for row in self.rows:
+                lcm = math.lcm(*(e.denominator for e in row))
+                M.append([e.numerator*(lcm//e.denominator) for e in row])
+                den *= lcm
+            return K(modular.det(M))/den
+
+        M = [list(row) for row in self.rows]
+        exquo = K.exquo
+        det, divisor = K.one, K.one
+        for k in range(n):
+            for i in range(k, n):
+                if M[i][k]:
+                    break
+            else:
+                return K.zero
+            if i != k:
+                M[k], M[i] = M[i], M[k]
+                det = -det
+            row = M[k]
+            pivot = row[k]
+            if K.is_Field:
+                det *= pivot
+                inv = K.one/pivot
+                for i in range(k + 1, n):
+                    if f := M[i][k]*inv:
+                        M[i] = [a - f*b for a, b in zip(M[i], row)]
+            else:
+                for i in range(k + 1, n):
+                    f = M[i][k]
+                    M[i] = [exquo(pivot*a - f*b, divisor)
+                            for a, b in zip(M[i], row)]
+                divisor = pivot
+        return det if K.is_Field else det*divisor
+
+    def inv(self):
+        """Return the inverse of ``self`` over the associated field.
+
+        Raises
+        ======
+
+        ValueError
+            If the matrix is singular.
+
+        """
+        if not self.is_square:
+            raise NonSquareMatrixError()
+        n = self.shape[0]
+        M = self.to_field()
+        K = M.domain
+        E = self.eye(n, K)
+        big = self.__class__([a + b for a, b in zip(M.rows, E.rows)],
+                             (n, 2*n), K)
+        big, pivots = big.rref()
+        if n and pivots[n - 1:n] != [n - 1]:
+            raise ValueError('Matrix det == 0; not invertible.')
+        return self.__class__([row[n:] for row in big.rows], (n, n), K)
+
+    def charpoly(self):
+        """Return coefficients of the characteristic polynomial.
+
+        Coefficients are listed from the leading one.  For integer and
+        rational matrices the multi-modular algorithm is used.  Over
+        other fields, the matrix is reduced to the Hessenberg form.
+        Else the Berkowitz algorithm is used, that doesn't require
+        division in the ground domain.
+
+        Examples
+        ========
+
+        >>> M = DomainMatrix.from_Matrix(Matrix([[1, 2], [3, 4]]))
+        >>> M.charpoly()
+        [1, -5, -2]
+
+        See Also
+        ========
+
+        diofant.matrices.modular.charpoly
+
+        """
+        if not self.is_square:
+            raise NonSquareMatrixError()
+        K, n = self.domain, self.shape[0]
+
+        if K.is_IntegerRing and n > 8:
+            return [K(c) for c in modular.charpoly(self.rows)]
+        if K.is_RationalField and n > 8:
+            den = math.lcm(*(e.denominator for row in self.rows for e in row))
+            M = [[e.numerator*(den//e.denominator) for e in row]
+                 for row in self.rows]
+            return [K(c)/den**k for k, c in enumerate(modular.charpoly(M))]
+        if K.is_Field:
+            return self._charpoly_hessenberg()
+        return self._charpoly_berkowitz()
+
+    def _charpoly_hessenberg(self):
+        K, n = self.domain, self.shape[0]
+        H = [list(row) for row in self.rows]
+
+        for m in range(1, n - 1):
+            for i in range(m, n):
+                if H[i][m - 1]:
+                    break
+            else:
+                continue
+            if i != m:
+                H[m], H[i] = H[i], H[m]
+                for row in H:
+                    row[m], row[i] = row[i], row[m]
+            inv = K.one/H[m][m - 1]
+            pivot, ts = H[m], {}
+            for i in range(m + 1, n):
+                if t := H[i][m - 1]*inv:
+                    H[i] = [a - t*b for a, b in zip(H[i], pivot)]
+                    ts[i] = t
+            if ts:
+                for row in H:
+                    row[m] += sum((t*row[i] for i, t in ts.items()), K.zero)
+
+        polys = [[K.one]]
+        for k in range(n):
+            poly = polys[k] + [K.zero]
+            h = H[k][k]
+            for j in range(1, k + 2):
+                poly[j] -= h*polys[k][j - 1]
+            t = K.one
+            for i in range(k - 1, -1, -1):
+                t *= H[i + 1][i]
+                if not t:
+                    break
+                if c := H[i][k]*t:
+                    for j, a in enumerate(polys[i], start=k - i + 1):
+                        poly[j] -= c*a
+            polys.append(poly)
+        return polys[n]
+
+    def _charpoly_berkowitz(self):
+        K, M, n = self.domain, self.rows, self.shape[0]
+        zero = K.zero
+
+        q = [K.one]
+        for k in range(n - 1, -1, -1):
+            R = M[k][k + 1:]
+            A = [row[k + 1:] for row in M[k + 1:]]
+            v = [row[k] for row in M[k + 1:]]
+            t = [K.one, -M[k][k]]
+            for i in range(n - k - 1):
+                t.append(-sum(map(operator.mul, R, v), zero))
+                if i < n - k - 2:
+                    v = [sum(map(operator.mul, row, v), zero) for row in A]
+            q = [sum((t[i - j]*q[j] for j in range(max(0, i - n + k), min(i, n - k - 1) + 1)), zero)
+                 for i in range(n - k + 1)]
+        return q
+
+
+def to_domain_matrix(M):
+    """Convert ``M`` to :class:`DomainMatrix`, if possible.
+
+    Returns ``None`` unless entries of ``M`` belong to some exact
+    domain, that is either numerical or a polynomial ring or a field
+    of rational functions, generated by symbols.  For other generators
+    (e.g. functions) some nonzero domain elements might be equal to
+    zero, which is invalid for division.
+
+    Examples
+    ========
+
+    >>> to_domain_matrix(Matrix([[x, 1]]))
+    DomainMatrix([[x, 1]], (1, 2), ZZ[x])
+    >>> to_domain_matrix(Matrix([[sin(x), 1]])) is None
+    True
+
+    """
+    if not all(isinstance(e, Expr) for row in M.tolist() for e in row):
+        return
+    M = DomainMatrix.from_Matrix(M)
+    K = M.domain
+    while K.is_PolynomialRing or K.is_FractionField:
+        if not all(s.is_Symbol for s in K.symbols):
+            return
+        K = K.domain
+    if K.is_Exact and not K.is_ExpressionDomain:
+        return M
@@ -4,7 +4,8 @@
 from ...core.sympify import sympify
 from ...logic import false
 from ...utilities import sift
-from .determinant import Determinant
+from ..matrices import MatrixBase
+from .determinant import Determinant, det
 from .inverse import Inverse
 from .matadd import MatAdd
 from .matexpr import Identity, MatrixExpr, ZeroMatrix
@@ -112,7 +113,26 @@ def _eval_trace(self):
                                   'blockshape')  # pragma: no cover
 
     def _eval_determinant(self):
-        return Determinant(self)
+        """Compute the determinant by recursive Schur complements.
+
+        Examples
+        ========
+
+        >>> A, B, C, D = (MatrixSymbol(_, n, n) for _ in 'ABCD')
+        >>> det(BlockMatrix([[A, B], [C, D]]))
+        Determinant(A)*Determinant(D + (-1)*C*A^-1*B)
+        >>> det(BlockMatrix([[A, B], [ZeroMatrix(n, n), D]]))
+        Determinant(A)*Determinant(D)
+
+        """
+        if not self.is_structurally_symmetric:
+            return Determinant(self)
+        try:
+            return _block_det(self.blocks.tolist())
+        except ValueError:
+            if all(isinstance(b, MatrixBase) for b in self.blocks):
+                return self.as_explicit().det()
+            return Determinant(self)
 
     def transpose(self):
         """Return transpose of matrix.
@@ -341,7 +361,86 @@ def bc_transpose(expr):
 
 
 def bc_inverse(expr):
-    return blockinverse_2x2(Inverse(reblock_2x2(expr.arg)))
+    B = expr.arg
+    if isinstance(B, BlockMatrix) and B.is_structurally_symmetric:
+        return BlockMatrix(_block_inverse(B.blocks.tolist()))
+    return blockinverse_2x2(Inverse(reblock_2x2(B)))
+
+
+def _is_zero(M):
+    return M.is_ZeroMatrix or (isinstance(M, MatrixBase) and M.is_zero)
+
+
+def _mul(*factors):
+    if any(_is_zero(M) for M in factors):
+        return ZeroMatrix(factors[0].rows, factors[-1].cols)
+    return MatMul(*factors).doit()
+
+
+def _add(shape, *terms):
+    terms = [M for M in terms if not _is_zero(M)]
+    if not terms:
+        return ZeroMatrix(*shape)
+    return MatAdd(*terms).doit()
+
+
+def _schur_complement(blocks, Ai=None):
+    """Return the Schur complement of the leading block.
+
+    Here ``blocks`` is a list of block rows and ``Ai`` --- the inverse
+    of the leading block.  Products with zero blocks are skipped and
+    the inverse is computed only if it's needed.
+
+    """
+    B, C = blocks[0][1:], [row[0] for row in blocks[1:]]
+    D = [row[1:] for row in blocks[1:]]
+    if all(_is_zero(M) for M in B) or all(_is_zero(M) for M in C):
+        return D, Ai
+    if Ai is None:
+        Ai = blocks[0][0].inverse()
+    AiB = [_mul(Ai, M) for M in B]
+    return [[_add(D[i][j].shape, D[i][j], -_mul(C[i], AiB[j]))
+             for j in range(len(B))] for i in range(len(C))], Ai
+
+
+def _block_det(blocks):
+    """Compute the determinant of a square block matrix.
+
+    The determinant of the leading block is multiplied by the
+    determinant of its Schur complement, that is computed recursively.
+
+    """
+    d = det(blocks[0][0])
+    if len(blocks) == 1:
+        return d
+    return d*_block_det(_schur_complement(blocks)[0])
+
+
+def _block_inverse(blocks):
+    """Compute the inverse of a square block matrix.
+
+    This uses the block LU decomposition with respect to the leading
+    block ``A``.  The inverse of its Schur complement ``S`` is computed
+    recursively and the result has the same block structure::
+
+        [A  B]^-1   [A^-1 + A^-1 B S^-1 C A^-1    -A^-1 B S^-1]
+        [C  D]    = [           -S^-1 C A^-1             S^-1]
+
+    """
+    A = blocks[0][0]
+    Ai = A.inverse()
+    if len(blocks) == 1:
+        return [[Ai]]
+    B, C = blocks[0][1:], [row[0] for row in blocks[1:]]
+    S, _ = _schur_complement(blocks, Ai)
+    Si = _block_inverse(S)
+    r = range(len(S))
+    AiB = [_mul(Ai, M) for M in B]
+    CAi = [_mul(M, Ai) for M in C]
+    top = [-_add(B[j].shape, *[_mul(AiB[k], Si[k][j]) for k in r]) for j in r]
+    left = [-_add(C[i].shape, *[_mul(Si[i][k], CAi[k]) for k in r]) for i in r]
+    corner = _add(A.shape, Ai, *[-_mul(AiB[k], left[k]) for k in r])
+    return [[corner] + top] + [[left[i]] + Si[i] for i in r]
 
 
 def blockinverse_2x2(expr):
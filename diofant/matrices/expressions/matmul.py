@@ -4,6 +4,7 @@
 from ...core.sympify import sympify
 from ...functions import adjoint
 from ..matrices import MatrixBase, ShapeError
+from .diagonal import DiagonalMatrix
 from .matexpr import Identity, MatrixExpr, ZeroMatrix
 from .transpose import transpose
 
@@ -138,9 +139,112 @@ def any_zeros(mul):
     return mul
 
 
+def chain_order(shapes, diagonal=()):
+    """Find the cheapest order of multiplication for a chain of matrices.
+
+    Here ``shapes`` is a list of pairs of integers and ``diagonal`` is an
+    optional list of flags, that mark diagonal factors.  The cost of
+    the product of ``m x k`` and ``k x n`` matrices is ``m*k*n`` scalar
+    multiplications or just ``m*n``, if one of factors is a product of
+    diagonal matrices.
+
+    Returns a pair of the minimal cost and the order of multiplication
+    as a binary tree with indices of factors in leaves.  Among orders
+    of equal cost, the left to right one is preferred.
+
+    Examples
+    ========
+
+    >>> chain_order([(10, 100), (100, 5), (5, 50)])
+    (7500, ((0, 1), 2))
+    >>> chain_order([(50, 5), (5, 100), (100, 10)])
+    (7500, (0, (1, 2)))
+
+    """
+    n = len(shapes)
+    diagonal = list(diagonal) or [False]*n
+    cost = {(i, i): 0 for i in range(n)}
+    split, diag = {}, {(i, i): diagonal[i] for i in range(n)}
+    for length in range(1, n):
+        for i in range(n - length):
+            j = i + length
+            diag[i, j] = diag[i, j - 1] and diagonal[j]
+            m, c = shapes[i][0], shapes[j][1]
+            best = None
+            for k in reversed(range(i, j)):
+                step = m*c
+                if not (diag[i, k] or diag[k + 1, j]):
+                    step *= shapes[k][1]
+                total = cost[i, k] + cost[k + 1, j] + step
+                if best is None or total < best:
+                    best, split[i, j] = total, k
+            cost[i, j] = best
+
+    def tree(i, j):
+        if i == j:
+            return i
+        k = split[i, j]
+        return tree(i, k), tree(k + 1, j)
+
+    return cost[0, n - 1], tree(0, n - 1)
+
+
+def _is_explicit(arg):
+    return (isinstance(arg, MatrixBase) or
+            (isinstance(arg, DiagonalMatrix) and
+             isinstance(arg.arg, MatrixBase)))
+
+
+def _multiply(A, B):
+    if isinstance(A, DiagonalMatrix):
+        if isinstance(B, DiagonalMatrix):
+            return DiagonalMatrix(A.arg.multiply_elementwise(B.arg))
+        return B._new(B.rows, B.cols, lambda i, j: A.arg[i]*B[i, j])
+    if isinstance(B, DiagonalMatrix):
+        return A._new(A.rows, A.cols, lambda i, j: A[i, j]*B.arg[j])
+    return A*B
+
+
+def multiply_chain(matrices):
+    """Multiply a chain of explicit matrices in the cheapest order.
+
+    Factors may be also :class:`~diofant.matrices.expressions.DiagonalMatrix`
+    of explicit matrices.  The order is found by :func:`chain_order`
+    and products of repeated subchains are computed once.
+
+    Examples
+    ========
+
+    >>> A = ImmutableMatrix([[1, 2]])
+    >>> B = ImmutableMatrix([[1], [1]])
+    >>> multiply_chain([A, B, A, B])
+    Matrix([[9]])
+
+    """
+    shapes = [(int(M.rows), int(M.cols)) for M in matrices]
+    diagonal = [isinstance(M, DiagonalMatrix) for M in matrices]
+    tree = chain_order(shapes, diagonal)[1]
+    cache = {}
+
+    def product(node):
+        if isinstance(node, int):
+            return matrices[node], node, node
+        A, i, _ = product(node[0])
+        B, _, j = product(node[1])
+        key = tuple(matrices[i:j + 1])
+        if key not in cache:
+            cache[key] = _multiply(A, B)
+        return cache[key], i, j
+
+    return product(tree)[0]
+
+
 def merge_explicit(matmul):
     """Merge explicit MatrixBase arguments
 
+    Chains of explicit matrices are multiplied in the cheapest order,
+    see :func:`multiply_chain`.
+
     >>> A = MatrixSymbol('A', 2, 2)
     >>> B = Matrix([[1, 1], [1, 1]])
     >>> C = Matrix([[1, 2], [3, 4]])
@@ -165,17 +269,32 @@ def merge_explicit(matmul):
     ⎣1  1⎦   ⎣3  4⎦
 
     """
-    if not any(isinstance(arg, MatrixBase) for arg in matmul.args):
+    if not any(_is_explicit(arg) for arg in matmul.args):
         return matmul
-    newargs = []
-    last = matmul.args[0]
-    for arg in matmul.args[1:]:
-        if isinstance(arg, (MatrixBase, Number)) and isinstance(last, (MatrixBase, Number)):
-            last = last * arg
+    newargs, run = [], []
+    for arg in matmul.args + (None,):
+        if isinstance(arg, Number) or (arg is not None and _is_explicit(arg)):
+            run.append(arg)
+            continue
+        numbers = [a for a in run if isinstance(a, Number)]
+        matrices = [a for a in run if not isinstance(a, Number)]
+        coeff = Mul(*numbers)
+        if not matrices:
+            if numbers:
+                newargs.append(coeff)
+        elif len(matrices) == 1 and isinstance(matrices[0], DiagonalMatrix):
+            newargs.extend(run)
         else:
-            newargs.append(last)
-            last = arg
-    newargs.append(last)
+            M = multiply_chain(matrices)
+            if coeff != 1:
+                if isinstance(M, DiagonalMatrix):
+                    newargs.append(coeff)
+                else:
+                    M = coeff*M
+            newargs.append(M)
+        if arg is not None:
+            newargs.append(arg)
+        run = []
 
     return MatMul(*newargs)
 
@@ -4,7 +4,7 @@
 from types import FunctionType
 
 from ..core import (Add, Atom, Basic, Dummy, Expr, Float, I, Integer, Pow,
-                    Symbol, count_ops, exp, oo, symbols)
+                    Rational, Symbol, count_ops, exp, oo, symbols)
 from ..core.logic import fuzzy_and
 from ..core.sympify import sympify
 from ..functions import Max, Min, factorial, sqrt
@@ -14,6 +14,8 @@
 from ..simplify import simplify as _simplify
 from ..utilities import as_int, default_sort_key, flatten
 from ..utilities.iterables import is_sequence
+from . import modular
+from .numeric import to_numeric_matrix
 
 
 def _iszero(x):
@@ -269,7 +271,11 @@ def inv(self, method=None, **kwargs):
         method : {'GE', 'LU', 'ADJ', 'CH', 'LDL'} or None
             Selects algorithm for inversion.  For dense matrices
             available {'GE', 'LU', 'ADJ'}, default is 'GE'.  For
-            sparse: {'CH', 'LDL'}, default is 'LDL'.
+            sparse: {'CH', 'LDL'}, default is 'LDL'.  If the method
+            isn't specified, the inverse of a matrix with floating-point
+            entries is computed numerically and if entries of the matrix
+            belong to some domain, the inverse is computed over this
+            domain.
 
         Raises
         ======
@@ -285,8 +291,15 @@ def inv(self, method=None, **kwargs):
         inverse_ADJ
 
         """
+        from .domainmatrix import to_domain_matrix
+
         if not self.is_square:
             raise NonSquareMatrixError()
+        if method is None and kwargs.keys() <= {'try_block_diag'}:
+            if N := to_numeric_matrix(self):
+                return N[0].inv().to_Matrix(self._new)
+            if M := to_domain_matrix(self):
+                return M.inv().to_Matrix(self._new)
         if method is not None:
             kwargs['method'] = method
         return self._eval_inverse(**kwargs)
@@ -481,6 +494,8 @@ def __mul__(self, other):
                 blst = B.T.tolist()
             except AttributeError:
                 return NotImplemented
+            if N := to_numeric_matrix(A, B):
+                return N[0].matmul(N[1]).to_Matrix(classof(A, B)._new)
             alst = A.tolist()
             return classof(A, B)._new(A.rows, B.cols, lambda i, j:
                                       functools.reduce(lambda k, l: k + l,
@@ -1179,8 +1194,8 @@ def print_nonzero(self, symb='X'):
     def LUsolve(self, rhs, iszerofunc=_iszero):
         """Solve the linear system Ax = rhs for x where A = self.
 
-        This is for symbolic matrices, for real or complex ones use
-        mpmath.lu_solve or mpmath.qr_solve.
+        If entries of matrices are floating-point numbers, the system is
+        solved numerically, see :mod:`~diofant.matrices.numeric`.
 
         See Also
         ========
@@ -1198,6 +1213,19 @@ def LUsolve(self, rhs, iszerofunc=_iszero):
         if rhs.rows != self.rows:
             raise ShapeError('`self` and `rhs` must have the same number of rows.')
 
+        if self.is_square and rhs.cols and (N := to_numeric_matrix(self, rhs)):
+            A, B = N
+            return A.solve(B).to_Matrix(rhs._new)
+        if (self.is_square and rhs.cols and
+                (A := modular.to_integer_rows(self.row_join(rhs))) is not None):
+            A, scales = A
+            B = [row[self.cols:] for row in A]
+            A = [row[:self.cols] for row in A]
+            if (X := modular.solve(A, B)) is None:
+                raise ValueError('Matrix det == 0; not invertible.')
+            X, den = X
+            return rhs.__class__([[Rational(x, den) for x in row] for row in X])
+
         A, perm = self.LUdecomposition_Simple(iszerofunc=_iszero)
         n = self.rows
         b = rhs.permuteFwd(perm).as_mutable()
@@ -1523,6 +1551,9 @@ def QRdecomposition(self):
         if not mat.rows >= mat.cols:
             raise MatrixError(
                 'The number of rows must be greater than columns')
+        if N := to_numeric_matrix(mat):
+            Q, R = N[0].qr()
+            return Q.to_Matrix(cls), R.to_Matrix(cls)
         n = mat.rows
         m = mat.cols
         rank = n
@@ -2375,13 +2406,21 @@ def is_diagonal(self):
                     return False
         return True
 
-    def det(self, method='bareiss'):
+    def det(self, method=None):
         """Computes the matrix determinant using the method "method".
 
         Possible values for "method":
           bareiss ... det_bareis
           berkowitz ... berkowitz_det
           det_LU ... det_LU_decomposition
+          modular ... det_modular
+
+        By default, the determinant of a matrix with floating-point
+        entries is computed numerically, see
+        :mod:`~diofant.matrices.numeric`.  Else it's computed over the
+        domain of matrix entries, if any (with the multi-modular
+        algorithm for rational matrices).  Bareiss' algorithm is used
+        otherwise.
 
         See Also
         ========
@@ -2389,8 +2428,11 @@ def det(self, method='bareiss'):
         det_bareiss
         berkowitz_det
         det_LU_decomposition
+        det_modular
 
         """
+        from .domainmatrix import to_domain_matrix
+
         # if methods were made internal and all determinant calculations
         # passed through here, then these lines could be factored out of
         # the method routines
@@ -2398,8 +2440,16 @@ def det(self, method='bareiss'):
             raise NonSquareMatrixError()
         if not self:
             return Integer(1)
+        if method is None:
+            if N := to_numeric_matrix(self):
+                return N[0].det()
+            if M := to_domain_matrix(self):
+                return M.domain.to_expr(M.det())
+            method = 'bareiss'
         if method == 'bareiss':
             return self.det_bareiss()
+        if method == 'modular':
+            return self.det_modular()
         if method == 'berkowitz':
             return self.berkowitz_det()
         if method == 'det_LU':
@@ -2474,6 +2524,35 @@ def det_bareiss(self):
 
         return det.expand()
 
+    def det_modular(self):
+        """Compute matrix determinant using a multi-modular algorithm.
+
+        Entries of the matrix must be rational numbers.  Determinant is
+        computed modulo several word-size primes and then recovered by
+        the Chinese Remainder Theorem.
+
+        Examples
+        ========
+
+        >>> Matrix([[1, 2], [3, Rational(1, 2)]]).det_modular()
+        -11/2
+
+        See Also
+        ========
+
+        det
+        diofant.matrices.modular.det
+
+        """
+        if not self.is_square:
+            raise NonSquareMatrixError()
+
+        if (A := modular.to_integer_rows(self)) is None:
+            raise ValueError('Matrix entries must be rational numbers.')
+
+        A, scales = A
+        return Rational(modular.det(A), math.prod(scales))
+
     def det_LU_decomposition(self):
         """Compute matrix determinant using LU decomposition
 
@@ -2608,7 +2687,18 @@ def rref(self, iszerofunc=_iszero, simplify=False):
         [1, 0],
         [0, 1]]), [0, 1])
 
+        If entries of the matrix belong to some domain and neither
+        ``iszerofunc`` nor ``simplify`` is given, the reduced form is
+        computed over this domain.
+
         """
+        from .domainmatrix import to_domain_matrix
+
+        if (iszerofunc is _iszero and not simplify and
+                (M := to_domain_matrix(self))):
+            M, pivots = M.rref()
+            return M.to_Matrix(self._new), pivots
+
         simpfunc = simplify if isinstance(
             simplify, FunctionType) else _simplify
         # pivot: index of next row to contain a pivot
@@ -2652,6 +2742,9 @@ def rank(self, iszerofunc=_iszero, simplify=False):
         2
 
         """
+        if (iszerofunc is _iszero and
+                (A := modular.to_integer_rows(self)) is not None):
+            return modular.rank(A[0], self.cols)
         row_reduced = self.rref(iszerofunc=iszerofunc, simplify=simplify)
         rank = len(row_reduced[-1])
         return rank
@@ -2660,6 +2753,12 @@ def nullspace(self, simplify=False, iszerofunc=_iszero):
         """Returns list of vectors (Matrix objects) that span nullspace of self."""
         from . import zeros
 
+        if (iszerofunc is _iszero and
+                (A := modular.to_integer_rows(self)) is not None):
+            _, basis, den = modular.nullspace(A[0], self.cols)
+            return [self._new(self.cols, 1, [Rational(a, den) for a in v])
+                    for v in basis]
+
         simpfunc = simplify if isinstance(
             simplify, FunctionType) else _simplify
         reduced, pivots = self.rref(simplify=simpfunc, iszerofunc=iszerofunc)
@@ -2856,7 +2955,34 @@ def berkowitz_charpoly(self, x=Dummy('lambda'), simplify=_simplify):
         """
         return PurePoly(list(map(simplify, reversed(self.berkowitz()[-1]))), x)
 
-    charpoly = berkowitz_charpoly
+    def charpoly(self, x=Dummy('lambda'), simplify=_simplify):
+        """Computes characteristic polynomial of the matrix.
+
+        If entries of the matrix belong to some domain, the polynomial
+        is computed over this domain.  Else the Berkowitz method is used
+        and coefficients are simplified with ``simplify``.
+
+        Examples
+        ========
+
+        >>> Matrix([[1, 3], [2, x]]).charpoly(y)
+        PurePoly(y**2 + (-x - 1)*y + x - 6, y, domain='ZZ[x]')
+
+        See Also
+        ========
+
+        berkowitz_charpoly
+
+        """
+        from .domainmatrix import to_domain_matrix
+
+        if not self.is_square:
+            raise NonSquareMatrixError()
+
+        if M := to_domain_matrix(self):
+            to_expr = M.domain.to_expr
+            return PurePoly([to_expr(c) for c in reversed(M.charpoly())], x)
+        return self.berkowitz_charpoly(x, simplify)
 
     def berkowitz_eigenvals(self, **flags):
         """Computes eigenvalues of a Matrix using Berkowitz method.
@@ -2870,26 +2996,35 @@ def berkowitz_eigenvals(self, **flags):
         return roots(self.berkowitz_charpoly(Dummy('x')), **flags)
 
     def eigenvals(self, **flags):
-        """Return eigen values using the berkowitz_eigenvals routine.
+        """Return eigen values as roots of the characteristic polynomial.
 
         Since the roots routine doesn't always work well with Floats,
         they will be replaced with Rationals before calling that
-        routine. If this is not desired, set flag ``rational`` to False.
+        routine.  If this is not desired, set flag ``rational`` to False.
+        Then eigenvalues of a matrix with floating-point entries are
+        computed numerically, see :mod:`~diofant.matrices.numeric`.
 
         """
-        # roots doesn't like Floats, so replace them with Rationals
-        # unless the nsimplify flag indicates that this has already
-        # been done, e.g. in eigenvects
         mat = self
         if not mat:
             return {}
-        if flags.pop('rational', True):
+        rational = flags.pop('rational', True)
+        if (not rational and flags.keys() <= {'multiple'} and
+                mat.is_square and (N := to_numeric_matrix(mat))):
+            vals = N[0].eigenvals()
+            if flags.get('multiple'):
+                return vals
+            return dict(collections.Counter(vals))
+        # roots doesn't like Floats, so replace them with Rationals
+        # unless the nsimplify flag indicates that this has already
+        # been done, e.g. in eigenvects
+        if rational:
             if any(v.has(Float) for v in mat):
                 mat = mat._new(mat.rows, mat.cols,
                                [nsimplify(v, rational=True) for v in mat])
 
         flags.pop('simplify', None)  # pop unsupported flag
-        return mat.berkowitz_eigenvals(**flags)
+        return roots(mat.charpoly(Dummy('x')), **flags)
 
     def eigenvects(self, **flags):
         """Return list of triples (eigenval, multiplicity, basis).
@@ -0,0 +1,435 @@
+"""Multi-modular algorithms for matrices with rational entries.
+
+Matrices are represented here as lists of rows of Python integers.  All
+computations are done modulo word-size primes and the exact result is
+recovered either by the Chinese Remainder Theorem, using the Hadamard
+bound for the determinant, or by p-adic lifting with rational number
+reconstruction.  Intermediate results are verified, so all functions
+below are deterministic and exact.
+
+References
+==========
+
+* :cite:`Dixon1982exact`
+* :cite:`Abbott1999det`
+
+"""
+
+import math
+import operator
+import random
+
+from ..core import Rational
+from ..domains import ZZ
+from ..ntheory import isprime
+from ..ntheory.modular import (integer_rational_reconstruction,
+                               symmetric_residue)
+
+
+_primes: list[int] = []
+
+
+def _iter_primes():
+    """Generate primes below ``2**62`` in decreasing order."""
+    k = 0
+    while True:
+        if k == len(_primes):
+            p = _primes[-1] - 2 if _primes else 2**62 - 1
+            while not isprime(p):
+                p -= 2
+            _primes.append(p)
+        yield _primes[k]
+        k += 1
+
+
+def to_integer_rows(M):
+    """Convert a matrix with rational entries to integer rows.
+
+    Returns a pair of the list of integer rows and the list of row
+    multipliers, which are used to clear denominators, or ``None``
+    if some entry of ``M`` isn't rational.
+
+    Examples
+    ========
+
+    >>> to_integer_rows(Matrix([[1, Rational(1, 2)], [Rational(2, 3), 1]]))
+    ([[2, 1], [2, 3]], [2, 3])
+    >>> to_integer_rows(Matrix([[1, x]])) is None
+    True
+
+    """
+    rows, scales = [], []
+    for row in M.tolist():
+        if not all(isinstance(e, Rational) for e in row):
+            return
+        lcm = math.lcm(*(e.denominator for e in row))
+        rows.append([e.numerator*(lcm//e.denominator) for e in row])
+        scales.append(lcm)
+    return rows, scales
+
+
+def hadamard_bound(A):
+    """Return an upper bound for the absolute value of ``det(A)``.
+
+    Examples
+    ========
+
+    >>> hadamard_bound([[1, 2], [3, 4]])
+    12
+
+    """
+    rows = math.prod(sum(a*a for a in row) for row in A)
+    cols = math.prod(sum(a*a for a in col) for col in zip(*A))
+    return math.isqrt(min(rows, cols)) + 1
+
+
+def _matmul(A, B):
+    cols = list(zip(*B))
+    return [[sum(map(operator.mul, row, col)) for col in cols] for row in A]
+
+
+def _lu_mod(A, p):
+    """Compute LU decomposition of ``A`` modulo a prime ``p``.
+
+    Returns a tuple of lower-triangular rows ``L`` (without the unit
+    diagonal), upper-triangular rows ``U`` (only entries starting from
+    the diagonal are stored), the row permutation and the determinant,
+    or ``None`` if ``A`` is singular modulo ``p``.
+
+    """
+    n = len(A)
+    U = [[a % p for a in row] for row in A]
+    L = [[] for _ in range(n)]
+    perm, det = list(range(n)), 1
+    for k in range(n):
+        for i in range(k, n):
+            if U[i][0]:
+                break
+        else:
+            return
+        if i != k:
+            U[k], U[i] = U[i], U[k]
+            L[k], L[i] = L[i], L[k]
+            perm[k], perm[i] = perm[i], perm[k]
+            det = -det
+        pivot = U[k]
+        det = det*pivot[0] % p
+        inv = pow(pivot[0], -1, p)
+        for i in range(k + 1, n):
+            f = U[i][0]*inv % p
+            L[i].append(f)
+            if f:
+                U[i] = [(a - f*b) % p for a, b in zip(U[i][1:], pivot[1:])]
+            else:
+                U[i] = U[i][1:]
+    return L, U, perm, det % p
+
+
+def _lu_solve(lu, B, p):
+    """Solve ``A X = B`` modulo ``p``, given LU decomposition of ``A``."""
+    L, U, perm, _ = lu
+    n = len(L)
+    X = []
+    for b in zip(*B):
+        y = []
+        for i in range(n):
+            y.append((b[perm[i]] - sum(map(operator.mul, L[i], y))) % p)
+        x = [0]*n
+        for i in range(n - 1, -1, -1):
+            s = y[i] - sum(map(operator.mul, U[i][1:], x[i + 1:]))
+            x[i] = s*pow(U[i][0], -1, p) % p
+        X.append(x)
+    return [list(row) for row in zip(*X)]
+
+
+def _echelon_mod(A, p):
+    """Return pivot columns and pivot rows of ``A`` modulo a prime ``p``."""
+    M = [[a % p for a in row] for row in A]
+    rows = list(range(len(M)))
+    pivots, r = [], 0
+    for j in range(len(M[0]) if M else 0):
+        for i in range(r, len(M)):
+            if M[i][j]:
+                break
+        else:
+            continue
+        M[r], M[i] = M[i], M[r]
+        rows[r], rows[i] = rows[i], rows[r]
+        inv = pow(M[r][j], -1, p)
+        pivot = M[r]
+        for i in range(r + 1, len(M)):
+            if f := M[i][j]*inv % p:
+                M[i] = [(a - f*b) % p for a, b in zip(M[i], pivot)]
+        pivots.append(j)
+        r += 1
+        if r == len(M):
+            break
+    return pivots, rows[:r]
+
+
+def _reconstruct(X, m):
+    """Rational reconstruction of all entries of ``X`` modulo ``m``.
+
+    Returns a pair of the integer matrix and its common denominator.
+
+    """
+    den, Y = 1, []
+    for row in X:
+        Y.append([])
+        for x in row:
+            q = integer_rational_reconstruction(x*den % m, m, ZZ)
+            if q is None:
+                return
+            Y[-1].append((q.numerator, den*q.denominator))
+            den *= q.denominator
+    return [[a*(den//b) for a, b in row] for row in Y], den
+
+
+def _dixon(A, B, p, lu):
+    """Solve ``A X = B`` by p-adic lifting.
+
+    Here ``lu`` is the LU decomposition of ``A`` modulo ``p``.
+
+    Returns a pair of the integer matrix and the common denominator of
+    solution.
+
+    """
+    D = hadamard_bound(A)
+    cols = [sum(a*a for a in col) for col in zip(*A)]
+    rhs = max(sum(b*b for b in col) for col in zip(*B))
+    N = math.isqrt(math.prod(cols)*rhs//min(cols)) + 1
+    steps = 1
+    while p**steps <= 2*max(N, D)**2:
+        steps += 1
+
+    X = [[0]*len(B[0]) for _ in A]
+    R, m, check = B, 1, 1
+    for k in range(1, steps + 1):
+        Xk = _lu_solve(lu, R, p)
+        X = [[x + m*y for x, y in zip(row, rowk)] for row, rowk in zip(X, Xk)]
+        AXk = _matmul(A, Xk)
+        R = [[(r - a)//p for r, a in zip(row, rowa)]
+             for row, rowa in zip(R, AXk)]
+        m *= p
+        if k == check or k == steps:
+            check *= 2
+            if (res := _reconstruct(X, m)) is not None:
+                Y, den = res
+                if _matmul(A, Y) == [[b*den for b in row] for row in B]:
+                    return Y, den
+    raise RuntimeError('lifting failed')  # pragma: no cover
+
+
+def _nullspace_mod(A, n, p):
+    """Compute pivots and nullspace basis of ``A`` using a prime ``p``.
+
+    Returns ``None`` if the prime is unlucky.
+
+    """
+    pivots, prows = _echelon_mod(A, p)
+    free = [j for j in range(n) if j not in pivots]
+    basis, den = [[int(i == j) for i in range(n)] for j in free], 1
+    if free and pivots:
+        sub = [[A[i][j] for j in pivots] for i in prows]
+        rhs = [[-A[i][j] for j in free] for i in prows]
+        Y, den = _dixon(sub, rhs, p, _lu_mod(sub, p))
+        for t, v in enumerate(basis):
+            v[free[t]] = den
+            for s, j in enumerate(pivots):
+                v[j] = Y[s][t]
+    if any(sum(map(operator.mul, row, v)) for v in basis for row in A):
+        return
+    return pivots, basis, den
+
+
+def nullspace(A, n):
+    """Return pivot columns of ``A`` and the basis of its nullspace.
+
+    Here ``n`` is the number of columns.  Basis vectors are returned as
+    lists of integers with a common denominator, that is the last
+    element of the result tuple.  Each vector has the reduced form,
+    i.e. a unit entry (after division by the denominator) at some
+    non-pivot position and zeros at other non-pivot positions.
+
+    Examples
+    ========
+
+    >>> nullspace([[1, 2, 3], [2, 4, 6]], 3)
+    ([0], [[-2, 1, 0], [-3, 0, 1]], 1)
+    >>> nullspace([[2, 1, 1]], 3)
+    ([0], [[-1, 2, 0], [-1, 0, 2]], 2)
+
+    """
+    for p in _iter_primes():
+        if (res := _nullspace_mod(A, n, p)) is not None:
+            return res
+
+
+def rank(A, n):
+    """Return rank of the integer matrix ``A`` with ``n`` columns.
+
+    Examples
+    ========
+
+    >>> rank([[1, 2, 3], [4, 5, 6], [7, 8, 9]], 3)
+    2
+
+    """
+    p = next(_iter_primes())
+    r = len(_echelon_mod(A, p)[0])
+    if r == min(len(A), n):
+        return r
+    return len(nullspace(A, n)[0])
+
+
+def _nonsingular_lu(A):
+    """Find a prime ``p`` with ``A`` nonsingular modulo ``p``.
+
+    Returns the prime and LU decomposition of ``A`` modulo it or
+    ``None`` if ``A`` is singular.
+
+    """
+    for p in _iter_primes():
+        if (lu := _lu_mod(A, p)) is not None:
+            return p, lu
+        if _nullspace_mod(A, len(A), p) is not None:
+            return
+
+
+def solve(A, B):
+    """Solve ``A X = B`` for a square integer matrix ``A``.
+
+    Returns the solution as a pair of an integer matrix and the common
+    denominator or ``None`` if ``A`` is singular.
+
+    Examples
+    ========
+
+    >>> from diofant.matrices.modular import solve
+    >>> solve([[2, 1], [1, 3]], [[1], [2]])
+    ([[1], [3]], 5)
+    >>> solve([[1, 2], [2, 4]], [[1], [2]]) is None
+    True
+
+    """
+    if (res := _nonsingular_lu(A)) is None:
+        return
+    return _dixon(A, B, *res)
+
+
+def det(A):
+    """Compute the determinant of a square integer matrix ``A``.
+
+    Residues of the determinant are computed for enough primes to
+    recover it from the Hadamard bound by the CRT.  For bigger matrices,
+    first a large divisor of the determinant is found as the common
+    denominator of the solution of a linear system with a random
+    right-hand side, so only few primes are usually needed.
+
+    Examples
+    ========
+
+    >>> from diofant.matrices.modular import det
+    >>> det([[1, 2], [3, 4]])
+    -2
+
+    """
+    n = len(A)
+    r, m, d = 0, 1, 1
+    if n > 8:
+        if (res := _nonsingular_lu(A)) is None:
+            return 0
+        p, lu = res
+        B = [[random.randint(-100, 100)] for _ in range(n)]
+        Y, den = _dixon(A, B, p, lu)
+        d = den//math.gcd(den, *(y for row in Y for y in row))
+        r, m = lu[-1]*pow(d, -1, p) % p, p
+    bound = 2*(hadamard_bound(A)//d) + 1
+    for p in _iter_primes():
+        if m > bound:
+            break
+        if m % p == 0 or d % p == 0:
+            continue
+        lu = _lu_mod(A, p)
+        v = lu[-1]*pow(d, -1, p) % p if lu else 0
+        r += m*((v - r)*pow(m, -1, p) % p)
+        m *= p
+    return d*symmetric_residue(r, m)
+
+
+def _charpoly_mod(A, p):
+    """Compute the characteristic polynomial of ``A`` modulo ``p``.
+
+    The matrix is reduced to the upper Hessenberg form by similarity
+    transformations and coefficients (from the leading one) are computed
+    by the recurrence for characteristic polynomials of its leading
+    principal submatrices.
+
+    """
+    n = len(A)
+    H = [[a % p for a in row] for row in A]
+    for m in range(1, n - 1):
+        for i in range(m, n):
+            if H[i][m - 1]:
+                break
+        else:
+            continue
+        if i != m:
+            H[m], H[i] = H[i], H[m]
+            for row in H:
+                row[m], row[i] = row[i], row[m]
+        inv = pow(H[m][m - 1], -1, p)
+        pivot, ts = H[m], {}
+        for i in range(m + 1, n):
+            if t := H[i][m - 1]*inv % p:
+                H[i] = [(a - t*b) % p for a, b in zip(H[i], pivot)]
+                ts[i] = t
+        if ts:
+            for row in H:
+                row[m] = (row[m] + sum(t*row[i] for i, t in ts.items())) % p
+
+    polys = [[1]]
+    for k in range(n):
+        poly = polys[k] + [0]
+        h = H[k][k]
+        for j in range(1, k + 2):
+            poly[j] -= h*polys[k][j - 1]
+        t = 1
+        for i in range(k - 1, -1, -1):
+            t = t*H[i + 1][i] % p
+            if not t:
+                break
+            if c := H[i][k]*t % p:
+                for j, a in enumerate(polys[i], start=k - i + 1):
+                    poly[j] -= c*a
+        polys.append([a % p for a in poly])
+    return polys[n]
+
+
+def charpoly(A):
+    """Compute the characteristic polynomial of a square integer matrix.
+
+    Coefficients are returned as a list, starting from the leading one.
+    Residues of coefficients are computed for enough primes to recover
+    them by the CRT from the Hadamard bound for principal minors.
+
+    Examples
+    ========
+
+    >>> charpoly([[1, 2], [3, 4]])
+    [1, -5, -2]
+
+    """
+    n = len(A)
+    norm = math.isqrt(max((sum(a*a for a in row) for row in A),
+                          default=0)) + 1
+    bound = 2*max(math.comb(n, k)*norm**k for k in range(n + 1)) + 1
+    r, m = [0]*(n + 1), 1
+    for p in _iter_primes():
+        if m > bound:
+            break
+        v = _charpoly_mod(A, p)
+        minv = pow(m, -1, p)
+        r = [a + m*((b - a)*minv % p) for a, b in zip(r, v)]
+        m *= p
+    return [symmetric_residue(a, m) for a in r]
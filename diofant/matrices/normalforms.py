@@ -0,0 +1,385 @@
+"""Hermite and Smith normal forms of integer matrices.
+
+If rows of a matrix generate a lattice of full rank, its Hermite normal
+form is computed modulo a multiple of the lattice determinant, so the
+size of entries stays bounded during elimination :cite:`Domich1987hnf`.
+Likewise, the Smith normal form of a nonsingular square matrix is
+computed modulo its determinant.  A classical elimination is used in
+other cases and to keep track of transformation matrices.
+
+References
+==========
+
+* :cite:`Domich1987hnf`
+* :cite:`Cohen1996course`
+
+"""
+
+import math
+
+from ..core import Integer
+from ..core.numbers import igcdex
+from .modular import _echelon_mod, _iter_primes, det, rank, solve
+
+
+def _identity(n):
+    return [[int(i == j) for j in range(n)] for i in range(n)]
+
+
+def _transpose(A, n):
+    return [list(col) for col in zip(*A)] if A else [[] for _ in range(n)]
+
+
+def _combine(A, i, k, j):
+    """Make ``A[k][j]`` zero using unimodular operation on rows ``i, k``.
+
+    Returns coefficients of the operation, that could be applied to
+    transformation matrices by :func:`_apply`.
+
+    """
+    a, b = A[i][j], A[k][j]
+    if not a:
+        op = 0, 1, 1, 0
+    elif b % a == 0:
+        op = 1, 0, -(b//a), 1
+    else:
+        g, u, v = igcdex(a, b)
+        op = u, v, -(b//g), a//g
+    _apply(A, i, k, op)
+    return op
+
+
+def _apply(A, i, k, op):
+    u, v, s, t = op
+    A[i], A[k] = ([u*x + v*y for x, y in zip(A[i], A[k])],
+                  [s*x + t*y for x, y in zip(A[i], A[k])])
+
+
+def _hnf_classical(A, n, U=None):
+    """Compute Hermite normal form of integer rows ``A`` in place.
+
+    If ``U`` is not ``None``, same row operations are applied to it.
+
+    """
+    m, r = len(A), 0
+    for j in range(n):
+        if r == m:
+            break
+        nonzero = [i for i in range(r, m) if A[i][j]]
+        if not nonzero:
+            continue
+        i = min(nonzero, key=lambda i: abs(A[i][j]))
+        A[r], A[i] = A[i], A[r]
+        if U is not None:
+            U[r], U[i] = U[i], U[r]
+        for k in range(r + 1, m):
+            if A[k][j]:
+                op = _combine(A, r, k, j)
+                if U is not None:
+                    _apply(U, r, k, op)
+        if A[r][j] < 0:
+            A[r] = [-x for x in A[r]]
+            if U is not None:
+                U[r] = [-x for x in U[r]]
+        for k in range(r):
+            if q := A[k][j]//A[r][j]:
+                A[k] = [x - q*y for x, y in zip(A[k], A[r])]
+                if U is not None:
+                    U[k] = [x - q*y for x, y in zip(U[k], U[r])]
+        r += 1
+    return A
+
+
+def _hnf_mod(A, n, D):
+    """Compute Hermite normal form of integer rows ``A`` modulo ``D``.
+
+    Rows of ``A`` must generate a lattice of rank ``n`` and ``D`` must
+    be a positive multiple of its determinant.  Returns ``n`` rows.
+
+    """
+    H, R, rows = [], D, A
+    for i in range(n):
+        pivot, rest = [0]*n, []
+        for row in rows:
+            row = [x % R for x in row]
+            if not row[i]:
+                if any(row):
+                    rest.append(row)
+            elif not pivot[i]:
+                pivot = row
+            else:
+                g, u, v = igcdex(pivot[i], row[i])
+                s, t = -(row[i]//g), pivot[i]//g
+                pivot, row = ([(u*x + v*y) % R for x, y in zip(pivot, row)],
+                              [(s*x + t*y) % R for x, y in zip(pivot, row)])
+                if any(row):
+                    rest.append(row)
+        d, u, _ = igcdex(pivot[i], R)
+        h = [u*x % R for x in pivot]
+        h[i] = d
+        for k in range(i):
+            if q := H[k][i]//d:
+                H[k] = [x - q*y for x, y in zip(H[k], h)]
+        H.append(h)
+        R //= d
+        rows = rest
+    return H
+
+
+def _full_rank_rows(A, n):
+    """Return indices of ``n`` linearly independent rows of ``A``."""
+    At = _transpose(A, n)
+    for p in _iter_primes():
+        pivots = _echelon_mod(At, p)[0]
+        if len(pivots) == n:
+            return pivots
+
+
+def hnf(A, n, transform=False):
+    """Compute Hermite normal form of integer rows ``A`` with ``n`` columns.
+
+    Returns rows of the upper-triangular matrix ``H`` with the shape of
+    ``A``, that has positive pivots, reduced entries above pivots and
+    zero rows at the bottom.  If ``transform`` is set, a pair of ``H``
+    and an unimodular matrix ``U`` with ``U A = H`` is returned.
+
+    If rows of ``A`` generate a lattice of rank ``n``, the Hermite normal
+    form of some ``n`` linearly independent rows ``B`` is computed modulo
+    ``|det(B)|``.  In this case, the transformation matrix for ``B`` is
+    recovered as ``H B^{-1}``.  The remaining rows (if any) are added by
+    classical elimination.
+
+    Examples
+    ========
+
+    >>> hnf([[2, 3], [4, 1]], 2)
+    [[2, 3], [0, 5]]
+    >>> hnf([[2, 3], [4, 1]], 2, transform=True)
+    ([[2, 3], [0, 5]], [[1, 0], [2, -1]])
+
+    """
+    m = len(A)
+    U = _identity(m) if transform else None
+    if m >= n and rank(A, n) == n:
+        idx = _full_rank_rows(A, n)
+        B = [A[i] for i in idx]
+        H = _hnf_mod(B if transform else A, n, abs(det(B)))
+        if not transform:
+            return H + [[0]*n for _ in range(m - n)]
+        X, den = solve(_transpose(B, n), _transpose(H, n))
+        U = [[0]*m for _ in range(n)]
+        for s, i in enumerate(idx):
+            for k in range(n):
+                U[k][i] = X[s][k]//den
+        others = [i for i in range(m) if i not in idx]
+        U.extend([int(i == j) for j in range(m)] for i in others)
+        A = H + [A[i] for i in others]
+    H = _hnf_classical([list(row) for row in A], n, U)
+    return (H, U) if transform else H
+
+
+def _snf_mod(T, R):
+    """Return elementary divisors of a nonsingular square matrix ``T``.
+
+    Here ``R`` is the absolute value of the determinant of ``T``.
+
+    """
+    n = len(T)
+    A = [[x % R for x in row] for row in T]
+    divisors = []
+    for i in range(n):
+        while True:
+            for k in range(i + 1, n):
+                if A[k][i]:
+                    _combine(A, i, k, i)
+                    A[i] = [x % R for x in A[i]]
+                    A[k] = [x % R for x in A[k]]
+            At = _transpose(A, n)
+            for k in range(i + 1, n):
+                if At[k][i]:
+                    _combine(At, i, k, i)
+                    At[i] = [x % R for x in At[i]]
+                    At[k] = [x % R for x in At[k]]
+            A = _transpose(At, n)
+            if not any(A[k][i] for k in range(i + 1, n)):
+                break
+        d = math.gcd(A[i][i], R)
+        divisors.append(d)
+        R //= d
+        A = [[x % R for x in row] for row in A]
+    return divisors
+
+
+def _invariant_factors(divisors):
+    """Transform diagonal entries to the divisibility chain."""
+    d = list(divisors)
+    for i, j in ((i, j) for i in range(len(d)) for j in range(i + 1, len(d))):
+        g = math.gcd(d[i], d[j])
+        d[i], d[j] = g, d[i]*d[j]//g
+    return d
+
+
+def _snf_classical(A, m, n, U, V):
+    """Compute Smith normal form of integer rows ``A`` in place.
+
+    Transformation matrices ``U`` and ``V`` (if not ``None``) are
+    updated by the same row and column operations.
+
+    """
+    At = None
+    for t in range(min(m, n)):
+        nonzero = [(i, j) for i in range(t, m) for j in range(t, n) if A[i][j]]
+        if not nonzero:
+            break
+        i, j = min(nonzero, key=lambda e: abs(A[e[0]][e[1]]))
+        A[t], A[i] = A[i], A[t]
+        if U is not None:
+            U[t], U[i] = U[i], U[t]
+        for row in A:
+            row[t], row[j] = row[j], row[t]
+        if V is not None:
+            for row in V:
+                row[t], row[j] = row[j], row[t]
+        while True:
+            for k in range(t + 1, m):
+                if A[k][t]:
+                    op = _combine(A, t, k, t)
+                    if U is not None:
+                        _apply(U, t, k, op)
+            At = _transpose(A, n)
+            Vt = _transpose(V, n) if V is not None else None
+            for k in range(t + 1, n):
+                if At[k][t]:
+                    op = _combine(At, t, k, t)
+                    if Vt is not None:
+                        _apply(Vt, t, k, op)
+            A[:] = _transpose(At, m)
+            if Vt is not None:
+                V[:] = _transpose(Vt, len(Vt[0]))
+            if any(A[k][t] for k in range(t + 1, m)):
+                continue
+            p = A[t][t]
+            bad = next((k for k in range(t + 1, m)
+                        if any(x % p for x in A[k][t + 1:])), None)
+            if bad is None:
+                break
+            A[t] = [x + y for x, y in zip(A[t], A[bad])]
+            if U is not None:
+                U[t] = [x + y for x, y in zip(U[t], U[bad])]
+        if A[t][t] < 0:
+            A[t] = [-x for x in A[t]]
+            if U is not None:
+                U[t] = [-x for x in U[t]]
+    return A
+
+
+def snf(A, n, transform=False):
+    """Compute Smith normal form of integer rows ``A`` with ``n`` columns.
+
+    Returns rows of the diagonal matrix ``S`` with the shape of ``A`` and
+    nonnegative diagonal entries, each dividing the next one.  If
+    ``transform`` is set, a triple of ``S`` and unimodular matrices ``U``
+    and ``V`` with ``U A V = S`` is returned.
+
+    Without transformation matrices, the nonzero block of the Hermite
+    normal form of ``A`` is reduced to a nonsingular square matrix ``T``
+    by computing the Hermite normal form of its transpose.  Then
+    the elementary divisors of ``T`` are computed modulo ``|det(T)|``.
+    Otherwise, a classical elimination is applied to the Hermite normal
+    form of ``A``.
+
+    Examples
+    ========
+
+    >>> snf([[2, 4, 4], [-6, 6, 12], [10, -4, -16]], 3)
+    [[2, 0, 0], [0, 6, 0], [0, 0, 12]]
+
+    """
+    m = len(A)
+    if transform:
+        H, U = hnf(A, n, transform=True)
+        V = _identity(n)
+        S = _snf_classical(H, m, n, U, V)
+        return S, U, V
+    H = [row for row in hnf(A, n) if any(row)]
+    r = len(H)
+    T = hnf(_transpose(H, n), r)[:r]
+    divisors = _invariant_factors(_snf_mod(T, math.prod(T[i][i] for i in range(r))))
+    return [[divisors[i] if i == j and i < r else 0 for j in range(n)]
+            for i in range(m)]
+
+
+def _to_rows(M):
+    if not all(isinstance(e, Integer) for e in M):
+        raise ValueError('Matrix should have integer entries.')
+    return [[int(e) for e in row] for row in M.tolist()]
+
+
+def hermite_normal_form(M, transform=False):
+    """Return Hermite normal form of an integer matrix ``M``.
+
+    The result ``H`` is upper-triangular, pivots are positive and
+    entries above pivots are nonnegative and less than pivots.  Zero
+    rows are at the bottom.  If ``transform`` is set, a pair of ``H``
+    and the unimodular matrix ``U`` with ``U*M == H`` is returned.
+
+    Examples
+    ========
+
+    >>> M = Matrix([[2, 3, 6], [4, 1, 2], [1, 1, 1]])
+    >>> hermite_normal_form(M)
+    Matrix([
+    [1, 0,  7],
+    [0, 1,  4],
+    [0, 0, 10]])
+    >>> H, U = hermite_normal_form(M, transform=True)
+    >>> U*M == H and abs(U.det()) == 1
+    True
+
+    See Also
+    ========
+
+    smith_normal_form
+
+    """
+    m, n = M.shape
+    res = hnf(_to_rows(M), n, transform)
+    if transform:
+        return M._new(m, n, sum(res[0], [])), M._new(m, m, sum(res[1], []))
+    return M._new(m, n, sum(res, []))
+
+
+def smith_normal_form(M, transform=False):
+    """Return Smith normal form of an integer matrix ``M``.
+
+    The result ``S`` is diagonal with nonnegative entries and each
+    diagonal entry divides the next one.  If ``transform`` is set,
+    a triple of ``S`` and unimodular matrices ``U`` and ``V`` with
+    ``U*M*V == S`` is returned.
+
+    Examples
+    ========
+
+    >>> M = Matrix([[2, 4, 4], [-6, 6, 12], [10, -4, -16]])
+    >>> smith_normal_form(M)
+    Matrix([
+    [2, 0,  0],
+    [0, 6,  0],
+    [0, 0, 12]])
+    >>> S, U, V = smith_normal_form(M, transform=True)
+    >>> U*M*V == S
+    True
+
+    See Also
+    ========
+
+    hermite_normal_form
+
+    """
+    m, n = M.shape
+    res = snf(_to_rows(M), n, transform)
+    if transform:
+        S, U, V = res
+        return (M._new(m, n, sum(S, [])), M._new(m, m, sum(U, [])),
+                M._new(n, n, sum(V, [])))
+    return M._new(m, n, sum(res, []))
@@ -0,0 +1,239 @@
+"""Numerical linear algebra for matrices with floating-point entries.
+
+Matrices, that have only real or complex floating-point or rational
+entries (i.e. after :meth:`~diofant.matrices.matrices.MatrixBase.evalf`),
+are converted to NumPy arrays of ``float64`` or ``complex128`` type,
+if NumPy is available and precision of entries doesn't exceed the
+double precision.  Otherwise, mpmath matrices are used with the
+working precision, that is the maximal precision of entries.  Results
+are converted back to :class:`~diofant.core.numbers.Float`'s.
+
+"""
+
+import functools
+
+import mpmath
+from mpmath.libmp import prec_to_dps
+
+from ..core import Float, I, Integer, Rational
+from ..external import import_module
+
+
+@functools.cache
+def _numpy():
+    return import_module('numpy')
+
+
+def _as_real_imag(e):
+    """Return real and imaginary parts of a numerical entry or ``None``."""
+    if isinstance(e, (Float, Rational)):
+        return e, Integer(0)
+    r, t = e.as_coeff_Add()
+    c, u = t.as_coeff_Mul()
+    if (u is I and isinstance(r, (Float, Rational)) and
+            isinstance(c, (Float, Rational))):
+        return r, c
+
+
+class NumericMatrix:
+    """Dense matrix of floating-point numbers.
+
+    Entries are stored either as a NumPy array (``prec`` is ``None``)
+    or as a mpmath matrix with the given precision.
+
+    Examples
+    ========
+
+    >>> A, = to_numeric_matrix(Matrix([[1.0, 2], [3, 4]]))
+    >>> A.det()
+    -2.00000000000000
+    >>> A.inv().to_Matrix()
+    Matrix([
+    [-2.0,  1.0],
+    [ 1.5, -0.5]])
+
+    """
+
+    def __init__(self, data, shape, prec=None):
+        """Initialize self."""
+        self.data = data
+        self.shape = shape
+        self.prec = prec
+
+    @classmethod
+    def from_parts(cls, parts, shape, prec=None):
+        """Create a matrix from rows of pairs of real and imaginary parts."""
+        if prec is None:
+            if any(im for row in parts for _, im in row):
+                data = [[complex(float(re), float(im)) for re, im in row]
+                        for row in parts]
+            else:
+                data = [[float(re) for re, _ in row] for row in parts]
+            data = _numpy().array(data).reshape(shape)
+        else:
+            with mpmath.workprec(prec):
+                data = mpmath.matrix(*shape)
+                for i, row in enumerate(parts):
+                    for j, (re, im) in enumerate(row):
+                        data[i, j] = re._to_mpmath(prec)
+                        if im:
+                            data[i, j] += im._to_mpmath(prec)*mpmath.j
+        return cls(data, shape, prec)
+
+    def _to_expr(self, x):
+        if self.prec is None:
+            x, dps = complex(x), None
+        else:
+            dps = prec_to_dps(self.prec)
+        re = Float(x.real, dps)
+        if not x.imag:
+            return re
+        return re + Float(x.imag, dps)*I
+
+    def to_Matrix(self, cls=None):
+        """Convert to a matrix with :class:`~diofant.core.numbers.Float` entries.
+
+        Optional argument ``cls`` is a constructor for the result.
+
+        """
+        from . import Matrix
+
+        cls = cls or Matrix
+        m, n = self.shape
+        return cls(m, n, [self._to_expr(self.data[i, j])
+                          for i in range(m) for j in range(n)])
+
+    def matmul(self, other):
+        """Return the matrix product of ``self`` and ``other``."""
+        shape = self.shape[0], other.shape[1]
+        if self.prec is None:
+            return NumericMatrix(self.data @ other.data, shape)
+        with mpmath.workprec(self.prec):
+            return NumericMatrix(self.data*other.data, shape, self.prec)
+
+    def det(self):
+        """Return the determinant of ``self``."""
+        if self.prec is None:
+            return self._to_expr(_numpy().linalg.det(self.data))
+        with mpmath.workprec(self.prec):
+            return self._to_expr(mpmath.det(self.data))
+
+    def inv(self):
+        """Return the inverse of ``self``.
+
+        Raises
+        ======
+
+        ValueError
+            If the matrix is (numerically) singular.
+
+        """
+        if self.prec is None:
+            numpy = _numpy()
+            try:
+                data = numpy.linalg.inv(self.data)
+            except numpy.linalg.LinAlgError as exc:
+                raise ValueError('Matrix det == 0; not invertible.') from exc
+        else:
+            with mpmath.workprec(self.prec):
+                try:
+                    data = mpmath.inverse(self.data)
+                except ZeroDivisionError as exc:
+                    raise ValueError('Matrix det == 0; not invertible.') from exc
+        return NumericMatrix(data, self.shape, self.prec)
+
+    def solve(self, rhs):
+        """Solve the linear system ``self*X = rhs``.
+
+        Raises
+        ======
+
+        ValueError
+            If the matrix is (numerically) singular.
+
+        """
+        if self.prec is None:
+            numpy = _numpy()
+            try:
+                data = numpy.linalg.solve(self.data, rhs.data)
+            except numpy.linalg.LinAlgError as exc:
+                raise ValueError('Matrix det == 0; not invertible.') from exc
+        else:
+            with mpmath.workprec(self.prec):
+                try:
+                    data = mpmath.lu_solve(self.data, rhs.data)
+                except ZeroDivisionError as exc:
+                    raise ValueError('Matrix det == 0; not invertible.') from exc
+        return NumericMatrix(data, rhs.shape, self.prec)
+
+    def qr(self):
+        """Return the reduced QR decomposition of ``self``.
+
+        Diagonal entries of the upper triangular factor are nonnegative.
+
+        """
+        m, n = self.shape
+        if self.prec is None:
+            Q, R = _numpy().linalg.qr(self.data)
+            d = R.diagonal().copy()
+            d[d == 0] = 1
+            s = d/abs(d)
+            Q, R = Q*s, R/s.reshape(n, 1)
+        else:
+            with mpmath.workprec(self.prec):
+                Q, R = mpmath.qr(self.data, mode='skinny')
+                for j in range(n):
+                    if d := R[j, j]:
+                        s = d/abs(d)
+                        for i in range(m):
+                            Q[i, j] *= s
+                        for k in range(n):
+                            R[j, k] /= s
+        return (NumericMatrix(Q, (m, n), self.prec),
+                NumericMatrix(R, (n, n), self.prec))
+
+    def eigenvals(self):
+        """Return the list of eigenvalues of ``self``."""
+        if self.prec is None:
+            vals = _numpy().linalg.eigvals(self.data)
+        else:
+            with mpmath.workprec(self.prec):
+                vals = mpmath.eig(self.data, left=False, right=False)
+        return [self._to_expr(v) for v in vals]
+
+
+def to_numeric_matrix(*matrices):
+    """Convert matrices to :class:`NumericMatrix` with common precision.
+
+    Returns ``None`` unless all entries are real or complex floating-point
+    or rational numbers and some entry is floating-point.
+
+    Examples
+    ========
+
+    >>> A, B = to_numeric_matrix(Matrix([[1.0, 2]]), Matrix([[1], [I]]))
+    >>> A.matmul(B).to_Matrix()
+    Matrix([[1.0 + 2.0*I]])
+    >>> to_numeric_matrix(Matrix([[1, 2]])) is None
+    True
+
+    """
+    parts, prec = [], 0
+    for M in matrices:
+        rows = []
+        for row in M.tolist():
+            rows.append([])
+            for e in row:
+                if (p := _as_real_imag(e)) is None:
+                    return
+                for c in p:
+                    if isinstance(c, Float):
+                        prec = max(prec, c._prec)
+                rows[-1].append(p)
+        parts.append(rows)
+    if not prec:
+        return
+    if prec <= 53 and _numpy():
+        prec = None
+    return [NumericMatrix.from_parts(rows, M.shape, prec)
+            for rows, M in zip(parts, matrices)]
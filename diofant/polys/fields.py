@@ -5,6 +5,7 @@
 import math
 
 from ..core import Expr, Symbol
+from ..core.cache import WeakLRUCache
 from ..core.sympify import CantSympify, sympify
 from ..domains.compositedomain import CompositeDomain
 from ..domains.domainelement import DomainElement
@@ -193,7 +194,7 @@ def is_normal(self, a):
         return self.domain.is_normal(a.numerator.LC)
 
 
-_field_cache: dict[tuple, FractionField] = {}
+_field_cache = WeakLRUCache('_field_cache')
 
 
 class FracElement(DomainElement, CantSympify):
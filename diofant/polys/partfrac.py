@@ -9,6 +9,7 @@
 from .polyerrors import PolynomialError
 from .polyoptions import allowed_flags, set_defaults
 from .polytools import parallel_poly_from_expr
+from .solvers import solve_lin_sys
 
 
 __all__ = 'apart', 'apart_list', 'assemble_partfrac_list'
@@ -162,12 +163,13 @@ def apart_undetermined_coeffs(P, Q):
         F += h*q
 
     system, result = [], Integer(0)
+    ring = Q.domain.field.poly_ring(*symbols)
 
     for (k,), coeff in F.terms():
-        system.append(coeff - P.coeff_monomial((k,)))
+        system.append(ring.convert(coeff - P.coeff_monomial((k,))))
 
-    from ..solvers import solve
-    solution = solve(system, symbols)[0]
+    solution = [(ring.symbols[ring.index(k)], ring.to_expr(v))
+                for k, v in solve_lin_sys(system, ring).items()]
 
     for h, f, k in partial:
         h = h.as_expr().subs(solution)
@@ -9,6 +9,7 @@
 from ..config import query
 from ..core import Add, Expr, Symbol, cacheit
 from ..core import symbols as _symbols
+from ..core.cache import WeakLRUCache
 from ..core.sympify import CantSympify, sympify
 from ..domains.compositedomain import CompositeDomain
 from ..domains.domainelement import DomainElement
@@ -349,7 +350,7 @@ def half_gcdex(self, a, b):
         return a.half_gcdex(b)
 
 
-_ring_cache: dict[tuple, PolynomialRing] = {}
+_ring_cache = WeakLRUCache('_ring_cache')
 
 
 class PolyElement(DomainElement, CantSympify, dict):
@@ -1,5 +1,7 @@
 """Low-level linear systems solver."""
 
+import collections
+
 from ..matrices import Matrix, zeros
 
 
@@ -21,24 +23,137 @@ def eqs_to_matrix(eqs, ring):
     return m
 
 
+def eqs_to_rows(eqs, ring):
+    """Transform from equations to sparse rows.
+
+    Each row is a dictionary, that maps column indices to nonzero
+    coefficients.  The last column (with index ``len(ring.gens)``)
+    is for the right-hand side.
+
+    """
+    n = len(ring.gens)
+    rows = []
+
+    for e_j in eqs:
+        row = {}
+        for monom, coeff in e_j.items():
+            deg = sum(monom)
+            if deg == 1:
+                row[monom.index(1)] = coeff
+            elif not deg:
+                row[n] = -coeff
+        rows.append(row)
+
+    return rows
+
+
+def sparse_rref(rows, ncols):
+    """Compute the reduced row echelon form of a sparse matrix.
+
+    Rows are dictionaries, that map column indices to nonzero elements
+    of some field.  Returns a dictionary, that maps pivot columns to
+    rows of the reduced form (with unit pivots).
+
+    Columns are eliminated from left to right, so the reduced form is
+    same as for the dense matrix.  For each column, the pivot is chosen
+    with the Markowitz criterion, i.e. the shortest row with a nonzero
+    entry in this column is taken to keep fill-in low.  Only rows with
+    nonzero entries in the pivot column are updated.
+
+    Examples
+    ========
+
+    >>> sparse_rref([{0: QQ(1), 1: QQ(2)}, {0: QQ(2), 1: QQ(4)}, {2: QQ(3)}], 3)
+    {0: {0: 1, 1: 2}, 2: {2: 1}}
+
+    """
+    active = dict(enumerate(filter(None, map(dict, rows))))
+    cols = collections.defaultdict(set)
+    for i, row in active.items():
+        for j in row:
+            cols[j].add(i)
+
+    pivots = {}
+    for j in range(ncols):
+        if not (rows_j := cols.pop(j, None)):
+            continue
+        i = min(rows_j, key=lambda i: (len(active[i]), i))
+        rows_j.remove(i)
+        prow = active.pop(i)
+        for k in prow:
+            if k != j:
+                cols[k].discard(i)
+        pivot = prow[j]
+        prow = {k: v/pivot for k, v in prow.items()}
+        pivots[j] = prow
+        for r in rows_j:
+            row = active[r]
+            f = row.pop(j)
+            for k, v in prow.items():
+                if k == j:
+                    continue
+                if k not in row:
+                    row[k] = -f*v
+                    cols[k].add(r)
+                elif c := row[k] - f*v:
+                    row[k] = c
+                else:
+                    del row[k]
+                    cols[k].discard(r)
+            if not row:
+                del active[r]
+
+    # back substitution
+    for j in sorted(pivots, reverse=True):
+        row = pivots[j]
+        for k in [k for k in row if k != j and k in pivots]:
+            f = row.pop(k)
+            for m, v in pivots[k].items():
+                if m == k:
+                    continue
+                if m not in row:
+                    row[m] = -f*v
+                elif c := row[m] - f*v:
+                    row[m] = c
+                else:
+                    del row[m]
+
+    return dict(sorted(pivots.items()))
+
+
 def solve_lin_sys(eqs, ring):
-    """Solve a system of linear equations."""
-    # transform from equations to matrix form
-    matrix = eqs_to_matrix(eqs, ring)
+    """Solve a system of linear equations.
+
+    Returns a dictionary, that maps pivot variables to their values
+    (elements of ``ring``, linear in free variables) or ``None`` if
+    the system is inconsistent.
 
-    # solve by row-reduction
-    echelon, pivots = matrix.rref(iszerofunc=lambda x: not x)
+    Equations are transformed to sparse rows, that are reduced with
+    :func:`sparse_rref`.
 
-    if not pivots:
-        return {}
-    if pivots[-1] == len(ring.gens):
+    Examples
+    ========
+
+    >>> R, x, y, z = ring('x y z', QQ)
+    >>> sol = solve_lin_sys([x + y - 2*z - 1, x - y], R)
+    >>> sol[x], sol[y]
+    (z + 1/2, z + 1/2)
+    >>> solve_lin_sys([x + y - 1, x + y], R) is None
+    True
+
+    """
+    n = len(ring.gens)
+    pivots = sparse_rref(eqs_to_rows(eqs, ring), n + 1)
+
+    if n in pivots:
         return
-    if len(pivots) == len(ring.gens):
-        sols = dict(zip(ring.gens, echelon[:, -1]))
-    else:
-        sols = {}
-        for i, p in enumerate(pivots):
-            vect = RawMatrix([[-x] for x in ring.gens[p+1:]] + [[ring.one]])
-            sols[ring.gens[p]] = (echelon[i, p + 1:]*vect)[0]
-
-    return {k: ring(v) for k, v in sols.items()}
+
+    monoms = [tuple(int(i == j) for i in range(n)) for j in range(n)]
+    sols = {}
+    for j, row in pivots.items():
+        sol = {monoms[k]: -v for k, v in row.items() if k != j and k != n}
+        if n in row:
+            sol[ring.zero_monom] = row[n]
+        sols[ring.gens[j]] = ring.from_dict(sol)
+
+    return sols
@@ -92,8 +92,34 @@ class NumPyPrinter(LambdaPrinter):
     }
 
     def _print_MatMul(self, expr):
-        """Matrix multiplication printer"""
-        return f"({').dot('.join(self._print(i) for i in expr.args)})"
+        """Matrix multiplication printer
+
+        Products are parenthesized in the cheapest order, if shapes of
+        all factors are known.
+
+        """
+        from ..matrices.expressions.matmul import chain_order
+
+        coeff, matrices = expr.as_coeff_matrices()
+        shapes = [M.shape for M in matrices]
+        if all(d.is_Integer for shape in shapes for d in shape):
+            tree = chain_order([tuple(map(int, _)) for _ in shapes])[1]
+        else:
+            tree = functools.reduce(lambda a, b: (a, b), range(len(matrices)))
+
+        def dot(node):
+            if isinstance(node, int):
+                return self._print(matrices[node])
+            left, right = node
+            left = dot(left) if isinstance(left, tuple) else f'({dot(left)})'
+            return f'{left}.dot({dot(right)})'
+
+        res = dot(tree)
+        if isinstance(tree, int):
+            res = f'({res})'
+        if coeff != 1:
+            res = f'{self._print(coeff)}*{res}'
+        return res
 
     def _print_Piecewise(self, expr):
         """Piecewise function printer"""
@@ -185,6 +185,27 @@ def _print_Pow(self, expr):
 
         return f'{self.parenthesize(expr.base, PREC)}{powsymbol}{self.parenthesize(expr.exp, PREC)}'
 
+    def _print_MatMul(self, expr):
+        from ..matrices.expressions.matmul import chain_order
+
+        coeff, matrices = expr.as_coeff_matrices()
+        shapes = [M.shape for M in matrices]
+        if not all(d.is_Integer for shape in shapes for d in shape):
+            return super()._print_MatMul(expr)
+        tree = chain_order([tuple(map(int, _)) for _ in shapes])[1]
+        PREC = precedence(expr)
+
+        def mul(node):
+            if isinstance(node, int):
+                return self.parenthesize(matrices[node], PREC)
+            left, right = node
+            right = f'({mul(right)})' if isinstance(right, tuple) else mul(right)
+            return f'{mul(left)}*{right}'
+
+        if coeff != 1:
+            return f'{self.parenthesize(coeff, PREC)}*{mul(tree)}'
+        return mul(tree)
+
     def _print_MatPow(self, expr):
         PREC = precedence(expr)
         return f'{self.parenthesize(expr.base, PREC)}^{self.parenthesize(expr.exp, PREC)}'
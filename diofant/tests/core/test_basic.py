@@ -5,9 +5,11 @@
 
 import pytest
 
-from diofant import (Add, Atom, Basic, Function, I, Integral, Symbol, cos,
-                     default_sort_key, exp, gamma, preorder_traversal, sin)
+from diofant import (Add, Atom, Basic, Dummy, Float, Function, I, Integral,
+                     Lambda, Symbol, Tuple, cos, default_sort_key, exp, gamma,
+                     preorder_traversal, sin)
 from diofant.abc import w, x, y, z
+from diofant.core.basic import BasicMeta, _interned, interning
 from diofant.core.singleton import S
 from diofant.core.singleton import SingletonWithManagedProperties as Singleton
 
@@ -215,3 +217,36 @@ class B(A[T]):
         pass
 
     B('x')
+
+
+def test_interning():
+    with interning():
+        e1 = Basic(Basic(x), y)
+        e2 = Basic(Basic(x), y)
+        assert e1 is e2
+        assert e1.args[0] is e2.args[0]
+        assert Basic(x) is e1.args[0]
+
+        assert Symbol('a') is Symbol('a')
+        assert Symbol('a') is not Symbol('a', positive=True)
+        assert Dummy('a') is not Dummy('a')
+        assert Float(1, 15) is not Float(1, 30)
+        assert (x + 1) is not (x + 1.0)
+        assert Lambda(x, x + 1) is not Lambda(y, y + 1)
+        assert Tuple(1, 2) is Tuple(1, 2)
+        assert sin(x + y).args[0] is (x + y)
+
+        with interning(False):
+            assert '__call__' not in BasicMeta.__dict__
+            assert Basic(x, z) is not Basic(x, z)
+        assert Basic(x, w) is Basic(x, w)
+
+    assert '__call__' not in BasicMeta.__dict__
+    assert Basic(x, w) is not Basic(x, w)
+
+    # canonical instances are not kept alive
+    with interning():
+        e = Basic(Basic(z), Basic(w))
+        n = len(_interned)
+    del e
+    assert len(_interned) < n
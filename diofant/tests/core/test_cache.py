@@ -6,7 +6,7 @@
 
 from diofant import cacheit, ordered, sstr, symbols
 from diofant.abc import x
-from diofant.core.cache import clear_cache, print_cache
+from diofant.core.cache import CACHE, WeakLRUCache, clear_cache, print_cache
 
 
 __all__ = ()
@@ -111,3 +111,39 @@ def test_sympyissue_8825():
     clear_cache()
     gc.collect()
     assert sstr(list(ordered(d.items()))) == '[(t2, 2)]'
+
+
+def test_WeakLRUCache(capfd):
+    class Box:
+        pass
+
+    c = WeakLRUCache('_test_cache', maxsize=2)
+    boxes = [Box() for _ in range(3)]
+
+    for i, b in enumerate(boxes):
+        c[i] = b
+
+    assert len(c) == 3
+    assert c.get(0) is boxes[0]
+    assert c.get(3) is None
+    assert c.get(3, 1) == 1
+    assert c.cache_info() == (1, 2, 2, 3)
+
+    print_cache()
+    resout, _ = capfd.readouterr()
+    assert resout.find('_test_cache ' + str(c.cache_info())) >= 0
+
+    del boxes[1:]
+    gc.collect()
+
+    assert 1 not in c  # not in LRU tail and not referenced
+    assert 2 in c
+
+    del boxes, b
+    clear_cache()
+    gc.collect()
+
+    assert len(c) == 0
+    assert c.cache_info() == (0, 0, 2, 0)
+
+    CACHE.remove(c)
@@ -1,7 +1,8 @@
 from diofant import (BlockDiagMatrix, BlockMatrix, Expr, Identity,
                      ImmutableMatrix, Inverse, Matrix, MatrixExpr,
-                     MatrixSymbol, Transpose, Tuple, block_collapse, blockcut,
-                     det, symbols, trace, transpose)
+                     MatrixSymbol, Transpose, Tuple, ZeroMatrix,
+                     block_collapse, blockcut, det, randMatrix, symbols, trace,
+                     transpose, zeros)
 from diofant.matrices.expressions.blockmatrix import (bc_block_plus_ident,
                                                       bc_dist, bc_matadd,
                                                       bc_matmul, bc_transpose,
@@ -131,6 +132,42 @@ def test_BlockMatrix_Determinant():
     X = BlockMatrix([[A, B], [C, D]])
 
     assert isinstance(det(X), Expr)
+    assert det(X) == det(A)*det(D - C*A.inverse()*B)
+
+    Z = ZeroMatrix(3, 3)
+    assert det(BlockMatrix([[A, B], [Z, D]])) == det(A)*det(D)
+    assert det(BlockMatrix([[A, Z], [C, D]])) == det(A)*det(D)
+    assert det(BlockMatrix([[A, B, C], [Z, D, A], [Z, Z, B]])) == det(A)*det(D)*det(B)
+
+    X = BlockMatrix([[Matrix([[0, 1], [1, 0]]), Matrix([[1], [2]])],
+                     [Matrix([[3, 4]]), Matrix([[5]])]])
+    assert det(X) == X.as_explicit().det() == 5
+
+    # singular leading block
+    X = BlockMatrix([[Matrix([[0, 1], [0, 0]]), Matrix([[1], [2]])],
+                     [Matrix([[3, 4]]), Matrix([[5]])]])
+    assert det(X) == X.as_explicit().det() == 6
+
+
+def test_BlockMatrix_Schur():
+    blocks = [[randMatrix(2, 2, seed=1), randMatrix(2, 3, seed=2), zeros(2, 1)],
+              [randMatrix(3, 2, seed=3), randMatrix(3, 3, seed=4), randMatrix(3, 1, seed=5)],
+              [zeros(1, 2), randMatrix(1, 3, seed=6), randMatrix(1, 1, seed=7)]]
+    X = BlockMatrix([[ImmutableMatrix(b) for b in row] for row in blocks])
+    M = X.as_explicit()
+    assert det(X) == M.det()
+
+    Xi = block_collapse(X.inverse())
+    assert isinstance(Xi, BlockMatrix)
+    assert Xi.blockshape == (3, 3)
+    assert Xi.as_explicit() == M.inv()
+
+    # block triangular matrix
+    A, B, D = (MatrixSymbol(_, n, n) for _ in 'ABD')
+    X = BlockMatrix([[A, B], [ZeroMatrix(n, n), D]])
+    assert block_collapse(X.inverse()) == BlockMatrix([
+        [A.inverse(), -A.inverse()*B*D.inverse()],
+        [ZeroMatrix(n, n), D.inverse()]])
 
 
 def test_squareBlockMatrix():
@@ -151,9 +188,10 @@ def test_squareBlockMatrix():
     assert (X * MatrixSymbol('Q', n + m, n + m)).is_MatMul
 
     assert block_collapse(Y.inverse()) == A.inverse()
+    S = D - C*A.inverse()*B
     assert block_collapse(X.inverse()) == BlockMatrix([
-        [(-B*D.inverse()*C + A).inverse(), -A.inverse()*B*(D + -C*A.inverse()*B).inverse()],
-        [-(D - C*A.inverse()*B).inverse()*C*A.inverse(), (D - C*A.inverse()*B).inverse()]])
+        [A.inverse() + A.inverse()*B*S.inverse()*C*A.inverse(), -A.inverse()*B*S.inverse()],
+        [-S.inverse()*C*A.inverse(), S.inverse()]])
 
     assert isinstance(X.inverse(), Inverse)
 
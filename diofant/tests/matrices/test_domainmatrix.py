@@ -0,0 +1,140 @@
+"""Tests for dense matrices over domains."""
+
+import random
+
+import pytest
+
+from diofant import (QQ, ZZ, Dummy, Matrix, NonSquareMatrixError, PurePoly,
+                     Rational, ShapeError, cancel, cos, eye, sin, sqrt, zeros)
+from diofant.abc import x, y
+from diofant.matrices.domainmatrix import DomainMatrix, to_domain_matrix
+
+
+__all__ = ()
+
+
+def test_DomainMatrix():
+    M = DomainMatrix([[1, 2], [3, 4]], (2, 2), ZZ)
+
+    assert M.shape == (2, 2)
+    assert M.domain == ZZ
+    assert M.is_square
+    assert repr(M) == 'DomainMatrix([[1, 2], [3, 4]], (2, 2), ZZ)'
+    assert M == DomainMatrix.from_Matrix(Matrix([[1, 2], [3, 4]]))
+    assert M != DomainMatrix([[1, 2], [3, 4]], (2, 2), QQ)
+    assert M.to_Matrix() == Matrix([[1, 2], [3, 4]])
+    assert M.copy() == M
+    assert M.copy().rows is not M.rows
+    assert M.convert_to(QQ).domain == QQ
+    assert M.to_field().domain == QQ
+
+    pytest.raises(ShapeError, lambda: DomainMatrix([[1, 2], [3]], (2, 2), ZZ))
+
+    assert DomainMatrix.eye(2, ZZ).to_Matrix() == eye(2)
+    assert DomainMatrix.zeros((2, 3), QQ).to_Matrix() == zeros(2, 3)
+
+    M = DomainMatrix.from_Matrix(Matrix([[x, 1/y]]))
+    assert M.domain == ZZ.inject(x, y).field
+    assert M.to_Matrix() == Matrix([[x, 1/y]])
+
+
+def test_arithmetic():
+    A = Matrix([[1, 2], [3, x]])
+    B = Matrix([[x, 0], [1, -1]])
+    K = ZZ.inject(x)
+    dA = DomainMatrix.from_Matrix(A, domain=K)
+    dB = DomainMatrix.from_Matrix(B, domain=K)
+
+    assert (dA + dB).to_Matrix() == A + B
+    assert (dA - dB).to_Matrix() == A - B
+    assert (-dA).to_Matrix() == -A
+    assert (dA*dB).to_Matrix() == (A*B).expand()
+    assert (dA*K(2)).to_Matrix() == 2*A
+    assert (dA**3).to_Matrix() == (A**3).expand()
+    assert (dA**0).to_Matrix() == eye(2)
+    assert dA.T.to_Matrix() == A.T
+
+    C = DomainMatrix.from_Matrix(Matrix([[1, 2, 3]]), domain=K)
+    pytest.raises(ShapeError, lambda: dA + C)
+    pytest.raises(ShapeError, lambda: dA*C)
+    pytest.raises(NonSquareMatrixError, lambda: C**2)
+    pytest.raises(ValueError, lambda: dA + DomainMatrix.from_Matrix(A, domain=QQ.inject(x)))
+
+
+def test_rref():
+    M = DomainMatrix.from_Matrix(Matrix([[1, 2], [2, 4]]))
+    assert M.rref_den() == (DomainMatrix([[1, 2], [0, 0]], (2, 2), ZZ),
+                            1, [0])
+    assert M.rref() == (DomainMatrix([[1, 2], [0, 0]], (2, 2), QQ), [0])
+    assert M.rank() == 1
+
+    M = Matrix([[x, 1, 2], [1, x, 3]])
+    R, pivots = DomainMatrix.from_Matrix(M).rref()
+    assert pivots == [0, 1]
+    assert (R.to_Matrix() - M.rref(simplify=True)[0]).applyfunc(cancel) == zeros(2, 3)
+
+    assert DomainMatrix.zeros((2, 3), ZZ).rref()[1] == []
+
+
+def test_det():
+    assert DomainMatrix.zeros((0, 0), ZZ).det() == 1
+    assert DomainMatrix.from_Matrix(Matrix([[x, 1], [1, x]])).det() == ZZ.inject(x)(x**2 - 1)
+    pytest.raises(NonSquareMatrixError,
+                  lambda: DomainMatrix.zeros((1, 2), ZZ).det())
+
+    random.seed(0)
+
+    for n in range(2, 12):
+        A = Matrix(n, n, lambda i, j: Rational(random.randint(-9, 9),
+                                               random.randint(1, 3)))
+        assert DomainMatrix.from_Matrix(A).det() == A.det_bareiss()
+        A[-1, :] = A[0, :]
+        assert DomainMatrix.from_Matrix(A).det() == 0
+
+
+def test_inv():
+    M = DomainMatrix.from_Matrix(Matrix([[1, 2], [3, 4]]))
+    assert M.inv().to_Matrix() == Matrix([[-2, 1], [Rational(3, 2), -Rational(1, 2)]])
+    pytest.raises(ValueError, lambda: DomainMatrix.from_Matrix(Matrix([[1, 2], [2, 4]])).inv())
+    pytest.raises(NonSquareMatrixError,
+                  lambda: DomainMatrix.zeros((1, 2), ZZ).inv())
+
+    M = Matrix([[x, 1], [y, 2]])
+    assert (DomainMatrix.from_Matrix(M).inv().to_Matrix()*M).applyfunc(cancel) == eye(2)
+
+
+def test_charpoly():
+    M = DomainMatrix.from_Matrix(Matrix([[1, 2], [3, 4]]))
+    assert M.charpoly() == [1, -5, -2]
+
+    lam = Dummy('lambda')
+
+    for A in [Matrix([[1, x, 0], [2, 3, y], [0, 1, x]]),
+              Matrix([[0, 1/x, 0, 1], [0, 0, 1, 0], [x, 0, 0, 0], [1, 0, 2, y]]),
+              Matrix([[sqrt(2), 1, 0], [0, 0, 1], [1, sqrt(2), 0]]),
+              Matrix(10, 10, lambda i, j: Rational(i - j, i + j + 1))]:
+        M = DomainMatrix.from_Matrix(A)
+        p = PurePoly([M.domain.to_expr(c) for c in reversed(M.charpoly())], lam)
+        assert p == A.berkowitz_charpoly(lam)
+
+
+def test_to_domain_matrix():
+    assert to_domain_matrix(Matrix([[1, x]])).domain == ZZ.inject(x)
+    assert to_domain_matrix(Matrix([[1, sqrt(2)]])).domain.is_AlgebraicField
+    assert to_domain_matrix(Matrix([[1.5, 1]])) is None
+    assert to_domain_matrix(Matrix([[sin(x), 1]])) is None
+    assert to_domain_matrix(Matrix([[1, 1/cos(x)]])) is None
+
+
+def test_Matrix_methods():
+    # secretly singular matrix is not inverted over a domain
+    M = Matrix([[sin(x)**2, 1], [1 - cos(x)**2, 1]])
+    assert M.det().simplify() == 0
+    pytest.raises(ValueError, M.inv)
+
+    M = Matrix([[x, 1], [1, x]])
+    assert M.det() == x**2 - 1
+    assert M.charpoly(y) == PurePoly(y**2 - 2*x*y + x**2 - 1, y)
+    assert M.eigenvals() == {x - 1: 1, x + 1: 1}
+    assert M.rref() == (eye(2), [0, 1])
+    assert (M.inv()*M).applyfunc(cancel) == eye(2)
@@ -1,13 +1,15 @@
 import pytest
 
-from diofant import (Adjoint, Basic, I, Identity, ImmutableMatrix, Inverse,
-                     MatMul, MatPow, Matrix, MatrixSymbol, ShapeError,
-                     Transpose, ZeroMatrix, adjoint, det, eye, symbols,
-                     transpose)
+from diofant import (Adjoint, Basic, DiagonalMatrix, I, Identity,
+                     ImmutableMatrix, Inverse, MatMul, MatPow, Matrix,
+                     MatrixSymbol, ShapeError, Transpose, ZeroMatrix, adjoint,
+                     det, eye, randMatrix, symbols, transpose)
 from diofant.core.strategies import null_safe
-from diofant.matrices.expressions.matmul import (any_zeros, factor_in_front,
-                                                 only_squares, remove_ids,
-                                                 unpack, xxinv)
+from diofant.matrices.expressions.matmul import (any_zeros, chain_order,
+                                                 factor_in_front,
+                                                 merge_explicit,
+                                                 multiply_chain, only_squares,
+                                                 remove_ids, unpack, xxinv)
 
 
 __all__ = ()
@@ -124,3 +126,40 @@ def test_collapse_MatrixBase():
 def test_matmul_new():
     pytest.raises(ShapeError, lambda: MatMul(A, C))
     MatMul(A, C, check=False)  # not raises
+
+
+def test_chain_order():
+    assert chain_order([(2, 3)]) == (0, 0)
+    assert chain_order([(10, 100), (100, 5), (5, 50)]) == (7500, ((0, 1), 2))
+    assert chain_order([(50, 5), (5, 100), (100, 10)]) == (7500, (0, (1, 2)))
+    assert chain_order([(3, 3)]*3) == (54, ((0, 1), 2))
+    assert chain_order([(30, 35), (35, 15), (15, 5), (5, 10), (10, 20),
+                        (20, 25)])[0] == 15125
+    assert chain_order([(5, 5), (5, 5), (5, 1)],
+                       [True, True, False]) == (10, (0, (1, 2)))
+
+
+def test_multiply_chain():
+    shapes = [(10, 1), (1, 10), (10, 1), (1, 10), (10, 2)]
+    mats = [ImmutableMatrix(randMatrix(*s, seed=i)) for i, s in enumerate(shapes)]
+    assert multiply_chain(mats) == mats[0]*mats[1]*mats[2]*mats[3]*mats[4]
+
+    d = ImmutableMatrix([1, 2, 3])
+    M = ImmutableMatrix(randMatrix(3, 2, seed=1))
+    D = DiagonalMatrix(d)
+    assert multiply_chain([D, M]) == ImmutableMatrix(D)*M
+    assert multiply_chain([M.T, D]) == M.T*ImmutableMatrix(D)
+    assert multiply_chain([D, D]) == DiagonalMatrix(ImmutableMatrix([1, 4, 9]))
+
+
+def test_merge_explicit():
+    X = MatrixSymbol('X', 3, 3)
+    d = ImmutableMatrix([1, 2, 3])
+    M = ImmutableMatrix(randMatrix(3, 3, seed=2))
+    D = DiagonalMatrix(d)
+
+    assert merge_explicit(MatMul(2, M, D, X)) == MatMul(2*M*ImmutableMatrix(D), X)
+    assert merge_explicit(MatMul(2, D, D, X)) == MatMul(2, DiagonalMatrix(ImmutableMatrix([1, 4, 9])), X)
+    assert merge_explicit(MatMul(2, D, X)) == MatMul(2, D, X)
+    assert merge_explicit(MatMul(X, 2, M, 3, X)) == MatMul(X, 6*M, X)
+    assert MatMul(M, D, M).doit() == M*ImmutableMatrix(D)*M
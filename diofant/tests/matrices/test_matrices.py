@@ -354,6 +354,31 @@ def test_determinant():
     assert m.rank() != 4
 
 
+def test_det_modular():
+    M = Matrix(((3, 2, 0, 0, 0),
+                (0, 3, 2, 0, 0),
+                (0, 0, 3, 2, 0),
+                (0, 0, 0, 3, 2),
+                (2, 0, 0, 0, 3)))
+
+    assert M.det(method='modular') == M.det() == 275
+
+    M = Matrix(((1, Rational(1, 2)), (Rational(1, 3), 1)))
+
+    assert M.det(method='modular') == Rational(5, 6)
+
+    M = Matrix(12, 12, lambda i, j: (i + 1)**j)
+
+    assert M.det() == M.det_bareiss() == 265790267296391946810949632000000000
+
+    M[0, :] = 2*M[1, :]
+
+    assert M.det() == 0
+
+    pytest.raises(NonSquareMatrixError, lambda: ones(2, 3).det_modular())
+    pytest.raises(ValueError, lambda: Matrix([[x]]).det_modular())
+
+
 def test_det_LU_decomposition():
 
     for M in [Matrix(), Matrix([[1]])]:
@@ -610,6 +635,12 @@ def test_LUsolve():
     soln = A.LUsolve(b)
     assert soln == x
 
+    A = Matrix(10, 10, lambda i, j: Rational(1, i + j + 1))
+    x = Matrix(10, 2, lambda i, j: (-1)**i*(j + 1))
+    assert A.LUsolve(A*x) == x
+
+    pytest.raises(ValueError, lambda: ones(3).LUsolve(Matrix([1, 2, 3])))
+
 
 def test_QRsolve():
     A = Matrix([[2, 3, 5],
@@ -812,6 +843,10 @@ def test_nullspace():
     M = Matrix([[1, 2], [2, 4], [3, 6]])
     assert M.nullspace()
 
+    M = Matrix(6, 7, lambda i, j: R((i + 1)*(j + 2) % 5, j + 1))
+    assert M.nullspace() == M.nullspace(iszerofunc=lambda e: e.equals(0))
+    assert M.rank() == M.rank(iszerofunc=lambda e: e.equals(0)) == 3
+
 
 def test_wronskian():
     assert wronskian([cos(x), sin(x)], x) == cos(x)**2 + sin(x)**2
@@ -0,0 +1,76 @@
+"""Tests for multi-modular algorithms for rational matrices."""
+
+import random
+
+from diofant import Matrix, Symbol
+from diofant.matrices.modular import (charpoly, det, hadamard_bound, nullspace,
+                                      rank, solve)
+
+
+__all__ = ()
+
+
+def test_hadamard_bound():
+    assert hadamard_bound([]) == 2
+    assert hadamard_bound([[3]]) == 4
+    assert hadamard_bound([[1, 2], [3, 4]]) == 12
+
+
+def test_det():
+    assert det([]) == 1
+    assert det([[0, 1], [1, 0]]) == -1
+
+    random.seed(1)
+
+    for n in range(1, 20):
+        A = [[random.randint(-30, 30) for _ in range(n)] for _ in range(n)]
+        assert det(A) == Matrix(A).det_bareiss()
+        A[-1] = [a - b for a, b in zip(A[0], A[-1])]
+        A[0] = [a - b for a, b in zip(A[0], A[-1])]
+        assert det(A) == Matrix(A).det_bareiss()
+        if n > 1:
+            A[0] = [3*a for a in A[1]]
+            assert det(A) == 0
+
+
+def test_solve():
+    assert solve([[2, 1], [1, 3]], [[1, 0], [0, 1]]) == ([[3, -1], [-1, 2]], 5)
+    assert solve([[0, 0], [0, 0]], [[1], [1]]) is None
+
+    random.seed(1)
+
+    for n in range(1, 15):
+        A = [[random.randint(-10**10, 10**10) for _ in range(n)]
+             for _ in range(n)]
+        B = [[random.randint(-5, 5)] for _ in range(n)]
+        X, d = solve(A, B)
+        assert Matrix(A)*Matrix(X) == d*Matrix(B)
+
+
+def test_nullspace():
+    assert nullspace([[0, 0]], 2) == ([], [[1, 0], [0, 1]], 1)
+    assert nullspace([[1, 2]], 2) == ([0], [[-2, 1]], 1)
+    assert nullspace([[1, 2], [3, 4]], 2) == ([0, 1], [], 1)
+    assert nullspace([[2, 1, 1]], 3) == ([0], [[-1, 2, 0], [-1, 0, 2]], 2)
+
+    assert rank([], 0) == 0
+    assert rank([[0, 0], [0, 0]], 2) == 0
+    assert rank([[1, 2], [2, 4], [3, 6]], 2) == 1
+    assert rank([[1, 2], [3, 4]], 2) == 2
+
+
+def test_charpoly():
+    assert charpoly([]) == [1]
+    assert charpoly([[3]]) == [1, -3]
+    assert charpoly([[0, 1], [1, 0]]) == [1, 0, -1]
+    assert charpoly([[0, 0, 1], [0, 0, 0], [1, 0, 0]]) == [1, 0, -1, 0]
+
+    x = Symbol('x')
+
+    random.seed(1)
+
+    for n in range(1, 12):
+        A = [[random.randint(-50, 50) if random.random() < 0.7 else 0
+              for _ in range(n)] for _ in range(n)]
+        p = Matrix(A).berkowitz_charpoly(x)
+        assert charpoly(A) == p.all_coeffs()[::-1]
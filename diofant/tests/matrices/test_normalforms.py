@@ -0,0 +1,100 @@
+"""Tests for Hermite and Smith normal forms."""
+
+import math
+import random
+
+import pytest
+
+from diofant import (ImmutableMatrix, Matrix, eye, hermite_normal_form,
+                     smith_normal_form, zeros)
+from diofant.abc import x
+from diofant.matrices.normalforms import _hnf_classical, hnf, snf
+
+
+__all__ = ()
+
+
+def test_hnf():
+    assert hnf([[2, 3], [4, 1]], 2) == [[2, 3], [0, 5]]
+    assert hnf([[0, 0], [0, 0]], 2) == [[0, 0], [0, 0]]
+    assert hnf([[2, 4, 6], [1, 2, 3]], 3) == [[1, 2, 3], [0, 0, 0]]
+    assert hnf([[6], [4], [9]], 1) == [[1], [0], [0]]
+    assert hnf([[6], [4], [9]], 1, transform=True)[0] == [[1], [0], [0]]
+
+    random.seed(0)
+
+    for _ in range(100):
+        m, n = random.randint(1, 6), random.randint(1, 6)
+        A = [[random.randint(-9, 9) for _ in range(n)] for _ in range(m)]
+        if m > 1 and random.random() < 0.3:
+            A[-1] = [2*a for a in A[0]]
+        H = hnf(A, n)
+        assert H == _hnf_classical([list(row) for row in A], n)
+        H2, U = hnf(A, n, transform=True)
+        assert H2 == H
+        assert Matrix(U)*Matrix(A) == Matrix(H)
+        assert abs(Matrix(U).det()) == 1
+
+
+def test_snf():
+    assert snf([[2, 4, 4], [-6, 6, 12], [10, -4, -16]], 3) == [[2, 0, 0],
+                                                               [0, 6, 0],
+                                                               [0, 0, 12]]
+    assert snf([[0, 0]], 2) == [[0, 0]]
+    assert snf([[2, 4, 6], [1, 2, 3]], 3) == [[1, 0, 0], [0, 0, 0]]
+
+    random.seed(0)
+
+    for _ in range(100):
+        m, n = random.randint(1, 6), random.randint(1, 6)
+        A = [[random.randint(-9, 9) for _ in range(n)] for _ in range(m)]
+        if m > 1 and random.random() < 0.3:
+            A[-1] = [3*a for a in A[0]]
+        S = snf(A, n)
+        S2, U, V = snf(A, n, transform=True)
+        assert S2 == S
+        assert Matrix(U)*Matrix(A)*Matrix(V) == Matrix(S)
+        assert abs(Matrix(U).det()) == abs(Matrix(V).det()) == 1
+        d = [S[i][i] for i in range(min(m, n))]
+        assert all(a >= 0 for a in d)
+        assert all(b % a == 0 if a else not b for a, b in zip(d, d[1:]))
+
+
+def test_hermite_normal_form():
+    M = Matrix([[2, 3, 6], [4, 1, 2], [1, 1, 1]])
+    assert hermite_normal_form(M) == Matrix([[1, 0, 7], [0, 1, 4],
+                                             [0, 0, 10]])
+    H, U = hermite_normal_form(M, transform=True)
+    assert U*M == H
+    assert abs(U.det()) == 1
+
+    M = ImmutableMatrix([[4, 6], [2, 3], [0, 5]])
+    H = hermite_normal_form(M)
+    assert isinstance(H, ImmutableMatrix)
+    assert H == Matrix([[2, 3], [0, 5], [0, 0]])
+
+    pytest.raises(ValueError, lambda: hermite_normal_form(Matrix([[x, 1]])))
+    pytest.raises(ValueError, lambda: hermite_normal_form(Matrix([[0.5]])))
+
+
+def test_smith_normal_form():
+    M = Matrix([[2, 4, 4], [-6, 6, 12], [10, -4, -16]])
+    assert smith_normal_form(M) == Matrix([[2, 0, 0], [0, 6, 0], [0, 0, 12]])
+    S, U, V = smith_normal_form(M, transform=True)
+    assert U*M*V == S
+    assert smith_normal_form(eye(3)) == eye(3)
+    assert smith_normal_form(zeros(2, 3)) == zeros(2, 3)
+
+    pytest.raises(ValueError, lambda: smith_normal_form(Matrix([[x]])))
+
+
+def test_large():
+    random.seed(1)
+    n = 30
+    A = [[random.randint(-99, 99) for _ in range(n)] for _ in range(n + 2)]
+    H, U = hnf(A, n, transform=True)
+    assert H == hnf(A, n)
+    assert Matrix(U)*Matrix(A) == Matrix(H)
+    S = snf(A, n)
+    assert all(S[i][i] == 1 for i in range(n - 1))
+    assert S[n - 1][n - 1] == math.prod(H[i][i] for i in range(n))
@@ -0,0 +1,93 @@
+"""Tests for numerical linear algebra."""
+
+import pytest
+
+from diofant import Float, I, Integer, Matrix, Rational, eye, sqrt
+from diofant.abc import x
+from diofant.external import import_module
+from diofant.matrices.numeric import to_numeric_matrix
+
+
+__all__ = ()
+
+numpy = import_module('numpy')
+with_numpy = pytest.mark.skipif(numpy is None,
+                                reason="Couldn't import numpy.")
+
+
+def approx_equal(A, B, eps=1e-12):
+    return all(abs(a - b) < eps for a, b in zip(A, B))
+
+
+def test_to_numeric_matrix():
+    assert to_numeric_matrix(Matrix([[1, 2]])) is None
+    assert to_numeric_matrix(Matrix([[1.0, x]])) is None
+    assert to_numeric_matrix(Matrix([[1.0, sqrt(2)]])) is None
+    assert to_numeric_matrix(Matrix([[1.0]]), Matrix([[x]])) is None
+
+    A, = to_numeric_matrix(Matrix([[Float(1, 30), Rational(1, 3)]]))
+    assert A.prec == Float(1, 30)._prec
+    assert A.to_Matrix() == Matrix([[1, Float(Rational(1, 3), 30)]])
+
+    A, = to_numeric_matrix(Matrix([[Float(1, 30)*I, 2 + Float(1, 30)*I]]))
+    assert approx_equal(A.to_Matrix(), [I, 2 + I], eps=1e-28)
+
+
+@with_numpy
+def test_numpy():
+    A, B = to_numeric_matrix(Matrix([[1.0, 2]]), Matrix([[1], [1 + I]]))
+    assert A.prec is None
+    assert A.data.dtype == numpy.float64
+    assert B.data.dtype == numpy.complex128
+    assert A.matmul(B).to_Matrix() == Matrix([[3.0 + 2.0*I]])
+
+
+def test_mpmath():
+    A, = to_numeric_matrix(Matrix([[Float(1, 30), 2], [3, 4]]))
+    assert A.det() == -2
+    assert A.inv().to_Matrix() == Matrix([[-2, 1], [Float(1.5, 30), -Float(0.5, 30)]])
+    assert approx_equal(A.eigenvals(), [(5 - sqrt(33))/2, (5 + sqrt(33))/2],
+                        eps=1e-28)
+
+    A, = to_numeric_matrix(Matrix([[Float(1, 30), 2], [2, 4]]))
+    pytest.raises(ValueError, A.inv)
+
+
+def test_Matrix_methods():
+    for prec in [15, 30]:
+        A = Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 10]]).evalf(prec)
+        b = Matrix([1, 2, Float(3, prec)])
+        eps = Float(10)**(2 - prec)
+
+        assert abs(A.det() + 3) < eps
+        assert all(e.is_Float for e in A.inv())
+        assert approx_equal(A.inv()*A, eye(3), eps)
+        assert approx_equal(A*A.LUsolve(b), b, eps)
+
+        Q, R = A.QRdecomposition()
+        assert approx_equal(Q*R, A, eps)
+        assert approx_equal(Q.T*Q, eye(3), eps)
+        assert all(R[i, i] > 0 for i in range(3))
+        assert all(R[i, j] == 0 for i in range(3) for j in range(i))
+
+        assert approx_equal(A*A, Matrix([[30, 36, 45], [66, 81, 102],
+                                         [109, 134, 169]]), eps)
+
+        vals = A.eigenvals(rational=False, multiple=True)
+        assert len(vals) == 3
+        assert abs(sum(vals) - 16) < eps
+        assert abs(vals[0]*vals[1]*vals[2] + 3) < eps
+
+        A = Matrix([[1, 2], [2, 4]]).evalf(prec)
+        pytest.raises(ValueError, A.inv)
+        pytest.raises(ValueError, lambda: A.LUsolve(Matrix([1, 2])))
+
+    A = Matrix([[1.0, I], [-I, 2]])
+    vals = A.eigenvals(rational=False, multiple=True)
+    assert approx_equal(sorted(vals, key=lambda v: v.as_real_imag()[0]),
+                        [(3 - sqrt(5))/2, (3 + sqrt(5))/2])
+    assert A.det() == 1
+    assert A.eigenvals() == {Rational(3, 2) - sqrt(5)/2: 1,
+                             Rational(3, 2) + sqrt(5)/2: 1}
+
+    assert (Matrix([[Integer(1)]])*Matrix([[1.5]]))[0] == 1.5
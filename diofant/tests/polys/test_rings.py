@@ -1,5 +1,6 @@
 """Test sparse polynomials."""
 
+import gc
 import math
 
 import pytest
@@ -10,7 +11,8 @@
                      PolynomialDivisionFailedError, PolynomialRing, Rational,
                      Symbol, field, grlex, lex, pi, ring, sin, sqrt, symbols)
 from diofant.abc import t, x, y, z
-from diofant.polys.rings import PolyElement
+from diofant.core.cache import clear_cache
+from diofant.polys.rings import PolyElement, _ring_cache
 from diofant.polys.specialpolys import f_polys
 
 
@@ -84,6 +86,31 @@ def test_PolynomialRing___eq__():
     assert ring('x y', QQ)[0] is not ring('x y z', QQ)[0]
 
 
+def test_PolynomialRing_cache():
+    R, *_ = ring('u v w', QQ)
+    key = 'PolynomialRing', R.symbols, 3, QQ, lex
+
+    assert key in _ring_cache
+    assert ring('u v w', QQ)[0] is R
+
+    info = _ring_cache.cache_info()
+
+    assert info.hits > 0
+    assert info.currsize == len(_ring_cache)
+
+    clear_cache()
+    gc.collect()
+
+    assert key in _ring_cache  # still referenced
+    assert ring('u v w', QQ)[0] is R
+
+    del R, _
+    clear_cache()
+    gc.collect()
+
+    assert key not in _ring_cache
+
+
 def test_PolynomialRing__call__():
     R, x = ring('x', ZZ)
 
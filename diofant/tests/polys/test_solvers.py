@@ -1,7 +1,7 @@
 """Tests for low-level linear systems solver."""
 
 from diofant import QQ, ZZ, field, ring, sqrt
-from diofant.polys.solvers import solve_lin_sys
+from diofant.polys.solvers import eqs_to_rows, solve_lin_sys, sparse_rref
 
 
 __all__ = ()
@@ -120,3 +120,36 @@ def test_solve_lin_sys_6x6_2():
     }
 
     assert solve_lin_sys(eqs, domain) == sol
+
+
+def test_sparse_rref():
+    assert sparse_rref([], 3) == {}
+    assert sparse_rref([{}, {}], 3) == {}
+    assert sparse_rref([{0: QQ(2), 2: QQ(4)}, {1: QQ(3)}],
+                       3) == {0: {0: 1, 2: 2}, 1: {1: 1}}
+    assert sparse_rref([{1: QQ(1), 2: QQ(1)}, {0: QQ(1), 1: QQ(1)},
+                        {0: QQ(1), 2: QQ(-1)}], 3) == {0: {0: 1, 2: -1},
+                                                       1: {1: 1, 2: 1}}
+
+    # the shortest row is chosen as a pivot
+    rows = [{0: QQ(1), 1: QQ(1), 2: QQ(1), 3: QQ(1)}, {0: QQ(1), 3: QQ(2)},
+            {1: QQ(1)}]
+    assert sparse_rref(rows, 4) == {0: {0: 1, 3: 2}, 1: {1: 1}, 2: {2: 1, 3: -1}}
+    assert rows[0] == {0: 1, 1: 1, 2: 1, 3: 1}
+
+
+def test_eqs_to_rows():
+    R, x, y = ring('x y', QQ)
+    assert eqs_to_rows([2*x - y + 3, y], R) == [{0: 2, 1: -1, 2: -3}, {1: 1}]
+
+
+def test_solve_lin_sys_sparse():
+    n = 300
+    R, *X = ring(','.join(f'x{i}' for i in range(n)), QQ)
+    eqs = [X[i] - X[i + 1] - 1 for i in range(n - 1)]
+    eqs.append(X[0] + X[-1])
+    sol = solve_lin_sys(eqs, R)
+    assert sol == {x: QQ(n - 1, 2) - i for i, x in enumerate(X)}
+
+    sol = solve_lin_sys(eqs[:-1], R)
+    assert sol == {x: X[-1] + n - 1 - i for i, x in enumerate(X[:-1])}
@@ -1,4 +1,4 @@
-from diofant import (And, Equality, MatrixSymbol, Mod, Or, Piecewise,
+from diofant import (And, Equality, MatrixSymbol, Mod, Or, Piecewise, Symbol,
                      Unequality, Xor)
 from diofant.abc import a, b, c, x
 from diofant.printing.lambdarepr import NumPyPrinter
@@ -18,6 +18,16 @@ def test_numpy_piecewise_regression():
 def test_numpyprinter():
     A, B = MatrixSymbol('A', 2, 2), MatrixSymbol('B', 2, 2)
     assert NumPyPrinter().doprint(A*B) == '(A).dot(B)'
+    assert NumPyPrinter().doprint(2*A*B) == '2*(A).dot(B)'
+
+    shapes = [(10, 100), (100, 5), (5, 50)]
+    A, B, C = [MatrixSymbol(_, *s) for _, s in zip('ABC', shapes)]
+    assert NumPyPrinter().doprint(A*B*C) == '(A).dot(B).dot(C)'
+    assert NumPyPrinter().doprint(C.T*B.T*A.T) == '(C.T).dot((B.T).dot(A.T))'
+
+    n = Symbol('n')
+    A, B, C = [MatrixSymbol(_, n, n) for _ in 'ABC']
+    assert NumPyPrinter().doprint(A*B*C) == '(A).dot(B).dot(C)'
 
 
 def test_relational():
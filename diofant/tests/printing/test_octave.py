@@ -325,6 +325,12 @@ def test_haramard():
     assert octave_code(C*A) == '(A.*B)*A'
     # mixing Hadamard and scalar strange b/c we vectorize scalars
     assert octave_code(C*x*y) == '(x.*y)*(A.*B)'
+    A = MatrixSymbol('A', 50, 5)
+    B = MatrixSymbol('B', 5, 100)
+    C = MatrixSymbol('C', 100, 10)
+    assert octave_code(A*B*C) == 'A*(B*C)'
+    assert octave_code(2*A*B*C) == '2*A*(B*C)'
+    assert octave_code(B*C*MatrixSymbol('E', 10, 100)) == 'B*C*E'
 
 
 def test_sparse():